@@ -0,0 +1 @@
+__all__ = [ "fake_roumen", "synthetic_db", "run" ]
@@ -0,0 +1,163 @@
+import http.server
+import threading
+import random
+import hashlib
+import time
+
+
+class FakeSite(object):
+	# the index page and the images of one site, everything is derived from the seed so the runs are comparable
+	def __init__(self, href_needle: str, item_count: int=50, image_size: int=32 * 1024, latency: float=0.0, error_rate: float=0.0, error_status: int=404, seed: int=0):
+		self._href_needle = href_needle
+		self._item_count = item_count
+		self._image_size = image_size
+		self._latency = latency
+		self._error_rate = error_rate
+		# the statuses retried by HttpSession (e.g. 503) make the failing items cost the backoff too
+		self._error_status = error_status
+		self._seed = seed
+		self._lock = threading.Lock()
+		self._request_count = 0
+		self._failed_names = self._pick_failed_names()
+
+	@property
+	def href_needle(self):
+		return self._href_needle
+
+	@property
+	def item_count(self):
+		return self._item_count
+
+	@property
+	def request_count(self):
+		with self._lock:
+			return self._request_count
+
+	def image_names(self):
+		return [f"{self._href_needle.split('.')[0]}-{self._seed}-{i:05d}.jpg" for i in range(self._item_count)]
+
+	def _pick_failed_names(self):
+		rnd = random.Random(self._seed)
+		return set(name for name in self.image_names() if rnd.random() < self._error_rate)
+
+	def index_page(self, encoding: str="cp1250"):
+		# a page shaped like the real one: the links wrapped in some markup, plus the links to ignore
+		rows = list()
+		for name in self.image_names():
+			rows.append(f"""<tr><td class="info"><a href="/{self._href_needle}?file={name}&amp;bbs=1" title="&#8222;{name}&#8220;">{name}</a></td><td>&#382;lu&#357;ou&#269;k&#253;</td></tr>""")
+			rows.append(f"""<tr><td><a href='/profile.php?user={name}'>profile</a></td></tr>""")
+		return f"""<!DOCTYPE html><html><head><title>fake</title></head><body><table>{"".join(rows)}</table></body></html>""".encode(encoding, errors="xmlcharrefreplace")
+
+	def image(self, name: str):
+		# a gif header and pseudo-random bytes (the same for the same name)
+		payload = bytearray(b"GIF89a")
+		block = hashlib.sha256(f"{self._seed}:{name}".encode("utf-8")).digest()
+		while len(payload) < self._image_size:
+			block = hashlib.sha256(block).digest()
+			payload += block
+		return bytes(payload[:self._image_size])
+
+	def is_failing(self, name: str):
+		return name in self._failed_names
+
+	@property
+	def error_status(self):
+		return self._error_status
+
+	def on_request(self):
+		with self._lock:
+			self._request_count += 1
+		if self._latency > 0:
+			time.sleep(self._latency)
+
+
+class _FakeSiteHandler(http.server.BaseHTTPRequestHandler):
+	protocol_version = "HTTP/1.1"
+	# the headers and the body are written apart, with nagle the client waits for the delayed ack
+	disable_nagle_algorithm = True
+
+	def log_message(self, format, *args):
+		pass
+
+	def do_GET(self):
+		site = self.server.site
+		site.on_request()
+
+		path = self.path.split("?")[0]
+		if path.startswith("/upload/"):
+			name = path[len("/upload/"):]
+			if site.is_failing(name):
+				self._send(site.error_status, b"", "text/plain")
+			else:
+				self._send(200, site.image(name), "image/gif")
+		elif path == "/":
+			self._send(200, self.server.index_page, "text/html; charset=windows-1250")
+		else:
+			self._send(404, b"", "text/plain")
+
+	def _send(self, status: int, body: bytes, content_type: str):
+		self.send_response(status)
+		self.send_header("Content-Type", content_type)
+		self.send_header("Content-Length", str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+
+class FakeRoumenServer(object):
+	# a local stand-in of a roumen site, "base_url" and "img_base" go to the _RoumenSettings of the scrapper
+	def __init__(self, site: FakeSite, host: str="127.0.0.1", port: int=0):
+		self._site = site
+		self._server = http.server.ThreadingHTTPServer((host, port), _FakeSiteHandler)
+		self._server.daemon_threads = True
+		self._server.site = site
+		self._server.index_page = site.index_page()
+		self._thread = None
+
+	@property
+	def site(self):
+		return self._site
+
+	@property
+	def base_url(self):
+		host, port = self._server.server_address[:2]
+		return f"http://{host}:{port}/"
+
+	@property
+	def img_base(self):
+		return self.base_url + "upload"
+
+	def start(self):
+		self._thread = threading.Thread(target=self._server.serve_forever, name=f"fake-{self._site.href_needle}", daemon=True)
+		self._thread.start()
+		return self
+
+	def serve_forever(self):
+		self._server.serve_forever()
+
+	def stop(self):
+		self._server.shutdown()
+		self._server.server_close()
+		if self._thread is not None:
+			self._thread.join()
+			self._thread = None
+
+	def __enter__(self):
+		return self.start()
+
+	def __exit__(self, exc_type, exc_value, tb):
+		self.stop()
+
+
+if __name__ == "__main__":
+	import sys
+	if len(sys.argv) not in (2, 3, 4, 5):
+		print(f"usage: python -m benchmarks.fake_roumen <port> [item count] [latency in seconds] [error rate]")
+		sys.exit(1)
+
+	site = FakeSite("roumingShow.php",
+		item_count=int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+		latency=float(sys.argv[3]) if len(sys.argv) > 3 else 0.0,
+		error_rate=float(sys.argv[4]) if len(sys.argv) > 4 else 0.0)
+	server = FakeRoumenServer(site, port=int(sys.argv[1]))
+	print(f"serving {site.item_count} items on {server.base_url}")
+	server.serve_forever()
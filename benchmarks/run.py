@@ -0,0 +1,275 @@
+import sys, os, pathlib
+import argparse
+import contextlib
+import json
+import platform
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+import scrappers
+from scrappers.extractors import EXTRACTORS, create_extractor
+from scrappers.impl.roumen import BaseRoumen, _RoumenSettings
+from .fake_roumen import FakeSite, FakeRoumenServer
+from .synthetic_db import build_synthetic_db
+
+
+class Measurement(object):
+	# "unit_count" units (items, rows, pages) are processed per run
+	def __init__(self, suite: str, name: str, samples: list, unit_count: int=1, unit: str="run", extra: dict=None):
+		self._suite = suite
+		self._name = name
+		self._samples = sorted(samples)
+		self._unit_count = unit_count
+		self._unit = unit
+		self._extra = extra if extra is not None else {}
+
+	@property
+	def median(self):
+		return statistics.median(self._samples)
+
+	@property
+	def p90(self):
+		return self._samples[max(0, -(-len(self._samples) * 9 // 10) - 1)]
+
+	@property
+	def throughput(self):
+		return self._unit_count / self.median if self.median > 0 else None
+
+	def as_dict(self):
+		return {
+			"suite": self._suite,
+			"name": self._name,
+			"runs": len(self._samples),
+			"median_ms": round(self.median * 1000, 3),
+			"p90_ms": round(self.p90 * 1000, 3),
+			"min_ms": round(self._samples[0] * 1000, 3),
+			"unit": self._unit,
+			"units_per_run": self._unit_count,
+			"units_per_s": None if self.throughput is None else round(self.throughput, 1),
+			**self._extra,
+		}
+
+	def __str__(self):
+		d = self.as_dict()
+		return f"{d['suite'] + '/' + d['name']:<44} {d['median_ms']:>10.3f} {d['p90_ms']:>10.3f} {d['units_per_s'] if d['units_per_s'] is not None else '-':>12} {d['unit']}/s"
+
+
+def measure(run_cb: callable, repeat: int, setup_cb: callable=None, warmup: int=1):
+	# the setup (not timed) makes the argument of the run, e.g. a fresh database
+	samples = list()
+	for i in range(warmup + repeat):
+		arg = setup_cb() if setup_cb is not None else None
+		ts_start = time.perf_counter()
+		run_cb(arg) if setup_cb is not None else run_cb()
+		elapsed = time.perf_counter() - ts_start
+		if i >= warmup:
+			samples.append(elapsed)
+	return samples
+
+
+def _chunked(content: bytes, chunk_size: int):
+	return (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+
+
+def bench_extractors(args):
+	site = FakeSite("roumingShow.php", item_count=args.items, seed=args.seed)
+	page = site.index_page()
+	expected = site.image_names()
+	results = list()
+
+	for name in EXTRACTORS.keys():
+		extracted = list(create_extractor(name, site.href_needle).extract(_chunked(page, BaseRoumen.DOWNLOAD_CHUNK_SIZE)))
+		# the extractors are interchangeable, a faster one is no good when it finds other links
+		if extracted != expected:
+			raise AssertionError(f"extractor \"{name}\" found {len(extracted)} links, {len([e for e in extracted if e not in expected])} unexpected")
+
+		samples = measure(lambda: list(create_extractor(name, site.href_needle).extract(_chunked(page, BaseRoumen.DOWNLOAD_CHUNK_SIZE))), args.repeat)
+		results.append(Measurement("extract", name, samples, len(expected), "item", { "page_bytes": len(page) }))
+
+	return results
+
+
+def _scrapper_settings(base_path: pathlib.Path, args):
+	return scrappers.Settings(
+		local_base_path=base_path,
+		local_relative_path=pathlib.Path("static").joinpath("images"),
+		sqlite_datafile=base_path / "image_box.sqlite3",
+		download_workers=args.workers,
+		link_extractor=args.extractor,
+		db_write_batch_size=50,
+		db_write_batch_interval=1.0,
+		)
+
+
+def bench_scrap(args, work_dir: pathlib.Path):
+	site = FakeSite("roumingShow.php", item_count=args.items, image_size=args.image_size, latency=args.latency, error_rate=args.error_rate, seed=args.seed)
+	results = list()
+
+	with FakeRoumenServer(site) as server:
+		roumen_settings = _RoumenSettings(server.base_url, {}, server.img_base, site.href_needle)
+		run_dirs = iter(range(1_000_000))
+
+		def _fresh_scrapper():
+			base_path = work_dir / f"scrap-{next(run_dirs)}"
+			base_path.mkdir()
+			settings = _scrapper_settings(base_path, args)
+			with contextlib.closing(sqlite3.connect(settings.sqlite_datafile)) as sql_connection:
+				scrappers.install(sql_connection)
+			return BaseRoumen(scrappers.Source.ROUMEN, settings, roumen_settings)
+
+		samples = measure(lambda r: r._scrap_image_names(), args.repeat, _fresh_scrapper)
+		results.append(Measurement("scrap", "index", samples, site.item_count, "item"))
+
+		phases = list()
+		def _scrap(r):
+			result = r.scrap()
+			if result.general_error_list:
+				raise AssertionError(f"scrap failed: {result.general_error_list[0]}")
+			phases.append(result.timings.durations)
+
+		samples = measure(_scrap, args.repeat, _fresh_scrapper)
+		phase_medians = { phase.value + "_ms": round(statistics.median(p[phase] for p in phases[1:]) * 1000, 3) for phase in scrappers.ScrapPhase }
+		results.append(Measurement("scrap", "full", samples, site.item_count, "item", phase_medians))
+
+		def _scrapped_once():
+			r = _fresh_scrapper()
+			r.scrap()
+			return r
+
+		# the second scrap of the same page, the validators spare the downloads
+		samples = measure(lambda r: r.scrap(), args.repeat, _scrapped_once)
+		results.append(Measurement("scrap", "unchanged", samples))
+
+	return results
+
+
+def bench_readers(args, datafile: pathlib.Path):
+	source = scrappers.Source.ROUMEN
+	item_reader = scrappers.DbScrapReader.create(datafile, source)
+	stat_reader = scrappers.DbStatReader.create(datafile)
+	limit = args.page_size
+
+	# a cursor in the middle of the items, the keyset pages should not get slower with the depth
+	all_items = sqlite3.connect(datafile).execute("select count(*) from scrap_items where source=?", (source.value, )).fetchone()[0]
+	middle = item_reader.read_recent_items(1)[0]
+	for _ in range(min(all_items // 2, 5000) // limit):
+		middle = item_reader.read_recent_items(limit, middle["cursor"])[-1]
+
+	readers = [
+		("recent_items", lambda: item_reader.read_recent_items(limit), limit),
+		("recent_items_deep", lambda: item_reader.read_recent_items(limit, middle["cursor"]), limit),
+		("most_viewed_items", lambda: item_reader.read_most_viewed_items(limit), limit),
+		("recent_item_names", lambda: item_reader.read_recent_item_names(args.days), None),
+		("last_scraps", lambda: stat_reader.read_last_scraps(100), 100),
+		("daily_stats", lambda: stat_reader.read_daily_stats(30), None),
+		("source_totals", lambda: stat_reader.read_source_totals(30), None),
+		("version", lambda: stat_reader.read_version(source), 1),
+	]
+
+	results = list()
+	for (name, read_cb, row_count) in readers:
+		_row_count = row_count if row_count is not None else len(read_cb())
+		results.append(Measurement("db", name, measure(read_cb, args.repeat), _row_count, "row"))
+	return results
+
+
+def bench_pages(args, datafile: pathlib.Path, work_dir: pathlib.Path):
+	# the app works on "image_box.sqlite3" of the current directory, it is imported there
+	app_dir = work_dir / "app"
+	app_dir.mkdir()
+	shutil.copy(datafile, app_dir / "image_box.sqlite3")
+	cwd = os.getcwd()
+	os.chdir(app_dir)
+	try:
+		import scrapper
+		# no scheduler, impression counter or backfill
+		scrapper.app.before_first_request_funcs = []
+		client = scrapper.app.test_client()
+
+		pages = [
+			("view", "/view/roumen/", scrappers.Source.ROUMEN.value),
+			("stats", "/stats/", None),
+		]
+
+		results = list()
+		for (name, url, source) in pages:
+			def _get(headers: dict=None, expected_status: int=200):
+				response = client.get(url, headers=headers if headers is not None else {})
+				if response.status_code != expected_status:
+					raise AssertionError(f"{url}: {response.status_code}")
+				return response
+
+			etag = _get().headers["ETag"]
+			results.append(Measurement("page", f"{name}_render", measure(lambda _: _get(), args.repeat, lambda: scrappers.ResponseCache.invalidate(source)), 1, "page"))
+			results.append(Measurement("page", f"{name}_cached", measure(_get, args.repeat), 1, "page"))
+			results.append(Measurement("page", f"{name}_not_modified", measure(lambda: _get({ "If-None-Match": etag }, 304), args.repeat), 1, "page"))
+
+		return results
+
+	finally:
+		os.chdir(cwd)
+
+
+SUITES = ("extract", "scrap", "db", "page")
+
+
+def main(argv: list):
+	parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="offline benchmarks of the scrappers, the database readers and the pages")
+	parser.add_argument("suites", nargs="*", metavar="suite", help=f"any of {', '.join(SUITES)} (default: all)")
+	parser.add_argument("--items", type=int, default=200, help="items on the fake index page")
+	parser.add_argument("--image-size", type=int, default=32 * 1024, help="bytes of a fake image")
+	parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every fake server response")
+	parser.add_argument("--error-rate", type=float, default=0.0, help="share of the fake images failing")
+	parser.add_argument("--workers", type=int, default=4, help="download workers")
+	parser.add_argument("--extractor", choices=list(EXTRACTORS.keys()), default="streaming")
+	parser.add_argument("--db-items", type=int, default=100_000, help="items in the synthetic database")
+	parser.add_argument("--days", type=int, default=365, help="days the synthetic items are spread over")
+	parser.add_argument("--page-size", type=int, default=100)
+	parser.add_argument("--repeat", type=int, default=5)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--json", type=pathlib.Path, help="write the results there too")
+	args = parser.parse_args(argv)
+	for suite in args.suites:
+		if suite not in SUITES:
+			parser.error(f"unknown suite \"{suite}\"")
+	args.suites = args.suites if len(args.suites) > 0 else list(SUITES)
+
+	results = list()
+	with tempfile.TemporaryDirectory(prefix="scrapper-bench-") as temp_dir:
+		work_dir = pathlib.Path(temp_dir)
+		datafile = None
+		if "db" in args.suites or "page" in args.suites:
+			datafile = work_dir / "synthetic.sqlite3"
+			build_synthetic_db(datafile, args.db_items, days=args.days, seed=args.seed)
+
+		if "extract" in args.suites:
+			results.extend(bench_extractors(args))
+		if "scrap" in args.suites:
+			results.extend(bench_scrap(args, work_dir))
+		if "db" in args.suites:
+			results.extend(bench_readers(args, datafile))
+		if "page" in args.suites:
+			results.extend(bench_pages(args, datafile, work_dir))
+
+		scrappers.database.close_thread_connections()
+
+	print(f"{'benchmark':<44} {'median ms':>10} {'p90 ms':>10} {'throughput':>12}")
+	for m in results:
+		print(m)
+
+	if args.json is not None:
+		args.json.write_text(json.dumps({
+			"arguments": { k: (str(v) if isinstance(v, pathlib.Path) else v) for (k, v) in vars(args).items() },
+			"environment": {
+				"python": platform.python_version(),
+				"sqlite": sqlite3.sqlite_version,
+				"platform": platform.platform(),
+			},
+			"results": [m.as_dict() for m in results],
+		}, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+	main(sys.argv[1:])
@@ -0,0 +1,109 @@
+import sys, pathlib
+import contextlib
+import datetime
+import random
+import sqlite3
+import scrappers
+from scrappers.util import formatters
+
+
+def build_synthetic_db(datafile: pathlib.Path, item_count: int=100_000, items_per_scrap: int=20, days: int=365, seed: int=0, ts_end: datetime.datetime=None):
+	# an "image_box.sqlite3" of the current schema with "item_count" items spread over the last "days" days,
+	# the same arguments make the same database (up to "ts_end", which defaults to now)
+	rnd = random.Random(seed)
+	sources = scrappers.SourceRegistry.sources()
+	_ts_end = ts_end if ts_end is not None else datetime.datetime.now()
+	scrap_count = max(1, item_count // items_per_scrap)
+	scrap_interval = datetime.timedelta(days=days) / scrap_count
+
+	with contextlib.closing(sqlite3.connect(datafile)) as sql_connection:
+		scrappers.install(sql_connection)
+
+		with sql_connection:
+			item_index = 0
+			for scrap_index in range(scrap_count):
+				source = sources[scrap_index % len(sources)].value
+				ts_start = _ts_end - scrap_interval * (scrap_count - scrap_index)
+				ts_stop = ts_start + datetime.timedelta(seconds=rnd.uniform(1.0, 30.0))
+				fail_count = 1 if rnd.random() < 0.05 else 0
+				scrap_stat_id = sql_connection.execute("""
+					insert into scrap_stat(source, ts_start_date, ts_start_time, ts_end_date, ts_end_time, ts_start_us, ts_end_us, status, succ_count, fail_count)
+					values (?, ?, ?, ?, ?, ?, ?, 'complete', ?, ?)""", (
+						source,
+						formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_start),
+						formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.TIME_MS, ts_start),
+						formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_stop),
+						formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.TIME_MS, ts_stop),
+						formatters.ts_to_us(ts_start),
+						formatters.ts_to_us(ts_stop),
+						items_per_scrap,
+						fail_count,
+					)).lastrowid
+
+				items = list()
+				for i in range(items_per_scrap):
+					ts_item = ts_start + (ts_stop - ts_start) * (i / items_per_scrap)
+					name = f"{source}-{item_index:07d}.jpg"
+					local_path = f"{source}/{formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_item)}/{name}"
+					items.append((
+						scrap_stat_id,
+						source,
+						formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_item),
+						formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.WEEK, ts_item),
+						formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.TIME_MS, ts_item),
+						formatters.ts_to_us(ts_item),
+						local_path,
+						name,
+						int(rnd.paretovariate(1.2)) - 1,
+						rnd.randint(20_000, 2_000_000),
+						f"{rnd.getrandbits(256):064x}",
+						local_path,
+						local_path,
+					))
+					item_index += 1
+
+				sql_connection.executemany("""
+					insert into scrap_items(scrap_stat_id, source, ts_date, ts_week, ts_time, ts_us, local_path, name, impressions, byte_count, content_hash, thumb_path, web_path)
+					values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""", items)
+
+				if fail_count > 0:
+					sql_connection.execute("""
+						insert into scrap_fails(scrap_stat_id, ts_date, ts_time, ts_us, item_name, description, exc_type, exc_value, exc_traceback)
+						values (?, ?, ?, ?, ?, 'scrap failure', 'HTTPError', '404 Client Error', '')""", (
+							scrap_stat_id,
+							formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_stop),
+							formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.TIME_MS, ts_stop),
+							formatters.ts_to_us(ts_stop),
+							f"{source}-failed-{scrap_index}.jpg",
+						))
+
+			# the rollups, as DbScrapWriter would have kept them
+			sql_connection.execute("delete from scrap_daily_stat;")
+			sql_connection.execute("""
+				insert into scrap_daily_stat
+				select
+					source,
+					ts_start_date,
+					count(*),
+					sum(status = 'complete'),
+					sum(status = 'unchanged'),
+					sum(status = 'failed'),
+					sum(succ_count),
+					sum(fail_count),
+					sum((select sum(byte_count) from scrap_items where scrap_items.scrap_stat_id=scrap_stat.scrap_stat_id)),
+					sum(ts_end_us - ts_start_us)
+				from scrap_stat
+				group by source, ts_start_date;""")
+
+		sql_connection.execute("analyze;")
+
+	return scrap_count, item_index
+
+
+if __name__ == "__main__":
+	if len(sys.argv) not in (2, 3):
+		print(f"usage: python -m benchmarks.synthetic_db <sqlite datafile> [item count]")
+		sys.exit(1)
+
+	scrap_count, item_count = build_synthetic_db(pathlib.Path(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else 100_000)
+	print(f"scraps: {scrap_count}, items: {item_count}")
@@ -1,7 +1,15 @@
-from flask import Flask, url_for, render_template, request
+from flask import Flask, url_for, render_template, request, jsonify, make_response, send_from_directory, abort, g
+from werkzeug.security import safe_join
 import sys, typing, traceback
+import os
 import random
+import datetime
+import time
 import sqlite3
+import contextlib
+import atexit
+import mimetypes
+import urllib.parse
 from pathlib import Path
 import scrappers
 
@@ -15,15 +23,86 @@ SETTINGS = {
 		"port": 5000,
 		"debug": True,
 	},
+	# the scrapped images (and their variants), served from "static/images" under "url-prefix"
+	"images": {
+		"url-prefix": "/images",
+		# "sendfile": by the app (zero-copy by the server's wsgi.file_wrapper, e.g. uWSGI),
+		# "x-sendfile": by the front server, the app sends just the "X-Sendfile" header (apache, lighttpd, uWSGI --collect-header),
+		# "x-accel": by nginx, the app sends just the "X-Accel-Redirect" header to the internal location "x-accel-location"
+		"serving": "sendfile",
+		"x-accel-location": "/protected-images/",
+		# the files never change once written
+		"max-age": 365 * 24 * 3600,
+	},
+	"assets": {
+		# compiled by lesscpy into "static/build/site.{hash}.css" when the app starts
+		"less": "site.less",
+		"build-dir": "build",
+		# the built files never change (their names do), so they are cached for good
+		"max-age": 365 * 24 * 3600,
+	},
+	# prometheus text format on "/metrics", per process
+	"metrics": {
+		"enabled": True,
+		# client addresses allowed to read them (behind a proxy on the same host, every request comes from the proxy's address)
+		"allowed-addresses": ["127.0.0.1", "::1"],
+	},
 	"sqlite3": {
 		"datafile": "image_box.sqlite3",
+		# scrapped items are written in batches of this many rows, or at least this often (seconds)
+		"write-batch-size": 50,
+		"write-batch-interval": 5.0,
+		# image views reported by the browsers are counted in memory and written this often (seconds)
+		"impressions-flush-interval": 10.0,
 	},
 	"limits": {
 		"images_shown": 100,
+		# items per page of "/api/<source>/items" (when not asked for "limit")
+		"api_items_page": 50,
+		# item ids accepted by a single "/api/impressions" report
+		"impressions_reported": 300,
 		"scraps_shown": 100,
+		# days summed up (and listed) by the stats page
+		"stats_days": 30,
 	},
+	# sources in addition to the built-in ones (roumen, roumen-maso), or replacing them by the same "source", e.g.
+	# { "source": "example", "title": "example", "base-url": "https://example.com", "base-url-params": {}, "img-base": "https://example.com/upload", "href-needle": "show.php", "interval": 3600 }
+	# "scrapper" (a "module:attribute" called with (source, settings, **the other keys)) is "link-pattern" by default
+	"sources": [],
+	# the sources of the installed packages, entry points of the "scrappers.sources" group
+	"source-entry-points": True,
 	"scrap": {
 		"auth-key": "wewewe",
+		"download-workers": 4,
+		"http-timeout": (5.0, 30.0),
+		# retries of the connection errors and of 429/5xx responses, with an exponential backoff (or as "Retry-After" says)
+		"http-retries": 3,
+		# requests per second to a host (shared by all the sources and the download workers on it), and how many at once
+		"host-rate-limit": 4.0,
+		"host-rate-burst": 4,
+		# after this many failed requests in a row, a host is left alone for "breaker-reset" seconds, the running scraps of it stop
+		"breaker-failures": 5,
+		"breaker-reset": 300.0,
+		"workers": 2,
+		# global deadline for a scrap of all sources, in seconds
+		"timeout": 600,
+		# items scrapped within this many days are not downloaded again
+		"dedup-window-days": 183,
+		# "streaming" or "bs4" (slow, but forgiving)
+		"link-extractor": "streaming",
+		"max-image-size": 50 * 1024 * 1024,
+		# "content" stores every image once under its hash (see "python -m scrappers.storage" for the existing ones), "dated" under {source}/{yyyy}/{week}
+		"image-store": "content",
+		# downscaled variants (max width in pixels) served by the views, made by Pillow
+		# the names are fixed, they have their own columns
+		"image-variants": {
+			"thumb": 480,
+			"web": 1280,
+		},
+		# makes the missing variants of the older items in the background
+		"variant-backfill": True,
+		# periodic scraps, source value -> interval in seconds (e.g. "roumen": 3600), overrides the "interval" of the source
+		"intervals": {},
 		"auth-error-messages": [
 			"You don't know the auth key. Do not mess with me!",
 			"Stop it! That's not the valid auth key.",
@@ -42,6 +121,13 @@ SETTINGS = {
 app = Flask(__name__)
 app.debug = SETTINGS["flask"]["debug"]
 
+request_duration = scrappers.Metrics.histogram("scrapper_http_request_duration_seconds", "Duration of the requests by endpoint.", ("endpoint", "method"))
+responses = scrappers.Metrics.counter("scrapper_http_responses_total", "Responses by endpoint and status code.", ("endpoint", "status"))
+
+
+def get_image_dir():
+	return request.script_root + SETTINGS["images"]["url-prefix"] + "/"
+
 
 def get_page_data(page_values: dict=None):
 	HTML_ENTITY_SYMBOL_HOME = "&#x2302;"
@@ -51,12 +137,15 @@ def get_page_data(page_values: dict=None):
 	page_data = {
 		"site": SETTINGS["site"],
 		"head": {
-			"less": url_for("static", filename="site.less"),
+			"css": url_for("page_asset", filename=compiled_css),
 		},
 		"current": {
 			"endpoint": None if request.endpoint is None else url_for(request.endpoint, **page_values if page_values is not None else {}),
-			"image_dir": url_for("static", filename="images") + "/",
+			"image_dir": get_image_dir(),
+			"image_variants": SETTINGS["scrap"]["image-variants"],
 			"debug": SETTINGS["flask"]["debug"],
+			# the ages are computed by the client ("static/js/age.js"), the timestamps are local time taken as utc
+			"ts_utc_offset_ms": scrappers.util.utc_offset() // datetime.timedelta(milliseconds=1),
 		},
 		"links": {
 			"griffin": url_for("page_griffin"),
@@ -68,9 +157,9 @@ def get_page_data(page_values: dict=None):
 		]
 	}
 
-	for s in scrappers.Source:
-		if s is not scrappers.Source.NOOP:
-			page_data["navigation"].append({"name":s.value, "href":url_for("page_view", source=s.value)})
+	for spec in scrappers.SourceRegistry.specs():
+		if spec.source is not scrappers.Source.NOOP:
+			page_data["navigation"].append({"name":spec.title, "href":url_for("page_view", source=spec.source.value)})
 
 	return page_data
 
@@ -87,13 +176,18 @@ def page_griffin():
 
 @app.route("/stats/")
 def page_stats():
-	page_data = get_page_data()
-	reader = scrappers.DbStatReader.create(SETTINGS["sqlite3"]["datafile"])
-	page_data["stats"] = {
-		"last_scraps": reader.read_last_scraps(SETTINGS["limits"]["scraps_shown"]),
-	}
+	def _render():
+		page_data = get_page_data()
+		page_data["stats"] = {
+			"days": SETTINGS["limits"]["stats_days"],
+			"source_totals": reader.read_source_totals(SETTINGS["limits"]["stats_days"]),
+			"daily": reader.read_daily_stats(SETTINGS["limits"]["stats_days"]),
+			"last_scraps": reader.read_last_scraps(SETTINGS["limits"]["scraps_shown"]),
+		}
+		return render_template("stats.html", page_data=page_data)
 
-	return render_template("stats.html", page_data=page_data)
+	reader = scrappers.DbStatReader.create(SETTINGS["sqlite3"]["datafile"])
+	return render_cached(("stats", None), reader.read_version(), _render)
 
 
 @app.route("/scrap/", methods=["GET"])
@@ -109,7 +203,18 @@ def page_scrap():
 
 		if request.method == "GET" and "auth-key" in request.args.keys():
 			if SETTINGS["scrap"]["auth-key"] == request.args.get("auth-key"):
-				page_data["scrapper_results"] = {s: scrap(s) for s in scrappers.Source if s is not scrappers.Source.NOOP}
+				job = scheduler.enqueue(scrappers.SourceRegistry.sources())
+				if job is not None:
+					page_data["scrap_job"] = {
+						"job_id": job.job_id,
+						"description": str(job),
+						"status_href": url_for("page_scrap_status", job_id=job.job_id),
+					}
+				else:
+					page_data["auth_error"] = {
+						"title": "Nothing to scrap",
+						"message": "There are no sources configured.",
+					}
 			else:
 				page_data["auth_error"] = {
 					"title": "Authentication error",
@@ -121,20 +226,166 @@ def page_scrap():
 	return render_template("scrap.html", page_data=page_data)
 
 
+@app.route("/scrap/status/<int:job_id>/")
+def page_scrap_status(job_id):
+	# read from the datafile, the job may be run by another worker process
+	job_status = scheduler.read_job_status(job_id)
+	if job_status is None:
+		return jsonify({"job_id": job_id, "error": "unknown job"}), 404
+
+	return jsonify(job_status)
+
+
 @app.route("/view/<source>/")
 def page_view(source):
-	page_data = get_page_data({"source": source})
-	try:
-		reader = scrappers.DbScrapReader.create(SETTINGS["sqlite3"]["datafile"], scrappers.Source.of(source))
+	scrap_source = scrappers.Source.of(source)
+	# the unknown sources would all share the cached page of NOOP (with the links of the first one rendered)
+	if scrap_source is scrappers.Source.NOOP:
+		abort(404)
+
+	page_data = get_page_data({"source": scrap_source.value})
+	def _render():
+		reader = scrappers.DbScrapReader.create(SETTINGS["sqlite3"]["datafile"], scrap_source)
 		page_data["images"] = reader.read_recent_items(SETTINGS["limits"]["images_shown"])
+		# the older items are loaded through the api on scroll
+		if len(page_data["images"]) == SETTINGS["limits"]["images_shown"]:
+			page_data["images_next_href"] = url_for("api_items", source=scrap_source.value, before=page_data["images"][-1]["cursor"])
 		return render_template("view.html", page_data=page_data)
+
+	try:
+		version = scrappers.DbStatReader.create(SETTINGS["sqlite3"]["datafile"]).read_version(scrap_source)
+		return render_cached(("view", scrap_source.value), version, _render)
 	except:
 		return render_exception_page(page_data=page_data)
 
 
+@app.route("/api/<source>/items")
+def api_items(source):
+	scrap_source = scrappers.Source.of(source)
+	if scrap_source is scrappers.Source.NOOP:
+		return jsonify({"source": source, "error": "unknown source"}), 404
+
+	limit = request.args.get("limit", SETTINGS["limits"]["api_items_page"], type=int)
+	reader = scrappers.DbScrapReader.create(SETTINGS["sqlite3"]["datafile"], scrap_source)
+	try:
+		items = reader.read_recent_items(limit, request.args.get("before"))
+	except ValueError:
+		return jsonify({"source": source, "error": "malformed cursor"}), 400
+
+	image_dir = get_image_dir()
+	# the scroll ends with an empty page
+	next_cursor = items[-1]["cursor"] if len(items) > 0 else None
+	return jsonify({
+		"source": source,
+		"items": [{
+			"name": i["name"],
+			"datetime": i["datetime"],
+			"ts_us": i["ts_us"],
+			"impressions": i["impressions"],
+			"original_href": image_dir + i["local_path"],
+			"thumb_href": image_dir + i["thumb_path"],
+			"web_href": image_dir + i["web_path"],
+			"cursor": i["cursor"],
+			"item_id": i["item_id"],
+		} for i in items],
+		"next": next_cursor,
+		"next_href": None if next_cursor is None else url_for("api_items", source=source, before=next_cursor, limit=limit),
+	})
+
+
+@app.route("/api/impressions", methods=["POST"])
+def api_impressions():
+	# views reported by "static/js/impressions.js", only counted here, written by the counter's thread
+	report = request.get_json(force=True, silent=True)
+	item_ids = report.get("items") if isinstance(report, dict) else None
+	if not isinstance(item_ids, list):
+		return jsonify({"error": "expected {\"items\": [item id, ...]}"}), 400
+
+	item_ids = [i for i in item_ids[:SETTINGS["limits"]["impressions_reported"]] if isinstance(i, int)]
+	impression_counter.add(item_ids)
+	return "", 204
+
+
+@app.route(SETTINGS["images"]["url-prefix"] + "/<path:filename>")
+def page_image(filename):
+	image_path = get_scrapper_settings().scrap_path
+	if SETTINGS["images"]["serving"] in ("x-accel", "x-sendfile"):
+		# the front server serves the file (conditional and range requests included), the path is checked here all the same
+		file_path = safe_join(str(image_path), filename)
+		if file_path is None or not os.path.isfile(os.path.join(app.root_path, file_path)):
+			abort(404)
+		response = app.response_class()
+		# percent-encoded (and decoded by the front server), the header values are latin-1 and the file names need not be
+		if SETTINGS["images"]["serving"] == "x-accel":
+			response.headers["X-Accel-Redirect"] = urllib.parse.quote(SETTINGS["images"]["x-accel-location"] + filename)
+		else:
+			response.headers["X-Sendfile"] = urllib.parse.quote(os.path.join(app.root_path, file_path))
+		response.content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+	else:
+		# conditional and range requests are answered by send_file
+		response = send_from_directory(image_path, filename, cache_timeout=SETTINGS["images"]["max-age"])
+
+	response.cache_control.public = True
+	response.cache_control.max_age = SETTINGS["images"]["max-age"]
+	response.cache_control.immutable = True
+	return response
+
+
+@app.route("/static/build/<filename>")
+def page_asset(filename):
+	response = send_from_directory(Path(app.static_folder) / SETTINGS["assets"]["build-dir"], filename, cache_timeout=SETTINGS["assets"]["max-age"])
+	response.cache_control.public = True
+	response.cache_control.immutable = True
+	return response
+
+
+@app.route("/metrics")
+def page_metrics():
+	if not SETTINGS["metrics"]["enabled"]:
+		abort(404)
+	# the per source failures and latencies are not for everyone
+	if request.remote_addr not in SETTINGS["metrics"]["allowed-addresses"]:
+		abort(403)
+
+	response = make_response(scrappers.Metrics.render())
+	response.headers["Content-Type"] = scrappers.Metrics.CONTENT_TYPE
+	response.cache_control.no_store = True
+	return response
+
+
+@app.before_request
+def start_request_timer():
+	g.ts_request_start = time.perf_counter()
+
+
+@app.after_request
+def observe_request(response):
+	# the unmatched urls are counted together, so the labels stay bounded
+	endpoint = request.endpoint if request.endpoint is not None else "none"
+	if "ts_request_start" in g:
+		request_duration.observe(time.perf_counter() - g.ts_request_start, endpoint=endpoint, method=request.method)
+	responses.inc(endpoint=endpoint, status=response.status_code)
+	return response
+
+
+def render_cached(cache_key: tuple, version: tuple, render_cb: callable):
+	# the page is rendered once per version (latest scrap id, latest scrap end), the clients revalidate it by etag
+	cached = scrappers.ResponseCache.get(cache_key, version)
+	if cached is None:
+		last_modified = None if version[1] is None else scrappers.util.us_to_utc(version[1])
+		cached = scrappers.ResponseCache.put(cache_key, version, render_cb(), last_modified)
+
+	response = make_response(cached.body)
+	response.set_etag(cached.etag)
+	response.last_modified = cached.last_modified
+	response.cache_control.no_cache = True
+	return response.make_conditional(request)
+
+
 @app.errorhandler(404)
 def page_not_found(e):
-	page_data = get_page_data()
+	# the matched endpoint (e.g. of a missing image) needs its arguments to build the url
+	page_data = get_page_data(request.view_args)
 	page_data["error"] = {
 		"code": e.code,
 		"name": e.name,
@@ -183,20 +434,78 @@ def fake_scrap(scrapper_source: scrappers.Source):
 	return r
 
 
-def scrap(scrapper_source: scrappers.Source):
-	scrapper_settings = scrappers.Settings(
+def get_scrapper_settings():
+	return scrappers.Settings(
 		local_base_path=Path.cwd(),
 		local_relative_path=Path("static").joinpath("images"),
 		sqlite_datafile=Path(SETTINGS["sqlite3"]["datafile"]),
+		download_workers=SETTINGS["scrap"]["download-workers"],
+		http_timeout=SETTINGS["scrap"]["http-timeout"],
+		http_retries=SETTINGS["scrap"]["http-retries"],
+		host_rate_limit=SETTINGS["scrap"]["host-rate-limit"],
+		host_rate_burst=SETTINGS["scrap"]["host-rate-burst"],
+		breaker_failures=SETTINGS["scrap"]["breaker-failures"],
+		breaker_reset=SETTINGS["scrap"]["breaker-reset"],
+		scrap_timeout=SETTINGS["scrap"]["timeout"],
+		db_write_batch_size=SETTINGS["sqlite3"]["write-batch-size"],
+		db_write_batch_interval=SETTINGS["sqlite3"]["write-batch-interval"],
+		dedup_window_days=SETTINGS["scrap"]["dedup-window-days"],
+		link_extractor=SETTINGS["scrap"]["link-extractor"],
+		max_image_size=SETTINGS["scrap"]["max-image-size"],
+		image_store=SETTINGS["scrap"]["image-store"],
+		image_variants=SETTINGS["scrap"]["image-variants"],
 		)
 
-	scrapper = scrappers.create(
-		source=scrapper_source,
-		settings=scrapper_settings
-		)
 
-	scrap_result = scrapper.scrap()
-	return scrap_result
+def install_database():
+	with contextlib.closing(sqlite3.connect(SETTINGS["sqlite3"]["datafile"])) as sql_connection:
+		scrappers.install(sql_connection)
+
+
+def check_image_variants():
+	# without Pillow every view would quietly serve the full size originals
+	if len(SETTINGS["scrap"]["image-variants"]) > 0 and not scrappers.VariantGenerator.available():
+		raise RuntimeError("the image variants are configured, but Pillow is not installed (pip install -r requirements.txt)")
+
+
+def compile_assets():
+	# a stylesheet that does not compile stops the app, the pages are not served unstyled
+	css_file_name = scrappers.util.compile_less(Path(app.static_folder) / SETTINGS["assets"]["less"], Path(app.static_folder) / SETTINGS["assets"]["build-dir"])
+	if css_file_name is None:
+		raise RuntimeError("the stylesheet cannot be compiled, lesscpy is not installed (pip install -r requirements.txt)")
+	return css_file_name
+
+
+install_database()
+check_image_variants()
+compiled_css = compile_assets()
+
+scrappers.SourceRegistry.configure(SETTINGS["sources"])
+if SETTINGS["source-entry-points"]:
+	scrappers.SourceRegistry.load_entry_points()
+
+# note: when running under uWSGI, threads have to be enabled (--enable-threads)
+scheduler = scrappers.ScrapScheduler(
+	settings=get_scrapper_settings(),
+	worker_count=SETTINGS["scrap"]["workers"],
+	intervals={
+		**{spec.source: spec.interval for spec in scrappers.SourceRegistry.specs() if spec.interval is not None},
+		**{scrappers.Source.of(s): i for (s, i) in SETTINGS["scrap"]["intervals"].items()},
+		},
+	)
+
+variant_backfill = scrappers.VariantBackfill(settings=get_scrapper_settings())
+
+impression_counter = scrappers.ImpressionCounter.get(Path(SETTINGS["sqlite3"]["datafile"]), SETTINGS["sqlite3"]["impressions-flush-interval"])
+atexit.register(impression_counter.stop)
+
+
+@app.before_first_request
+def start_scheduler():
+	scheduler.start()
+	impression_counter.start()
+	if SETTINGS["scrap"]["variant-backfill"]:
+		variant_backfill.start()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,32 @@
 __version__ = "v0.1"
-__all__ = [ "util", "sources", "settings", "result", "factory", "database", "install" ]
+__all__ = [ "util", "sources", "registry", "settings", "timing", "result", "politeness", "session", "extractors", "downloader", "storage", "variants", "factory", "runner", "scheduler", "database", "install" ]
 
+import importlib
 from .util.exception_info import ExceptionInfo
+from .util.response_cache import ResponseCache
+from .util.metrics import Metrics
 from .sources import Source
 from .settings import Settings
+from .registry import SourceRegistry, SourceSpec
+from .timing import ScrapTimings, ScrapPhase
 from .result import Result
+from .politeness import HostPoliteness, CircuitOpenError
 from .factory import create
-from .database import DbScrapWriter, DbScrapReader, DbStatReader
+from .runner import MultiScrapRunner
+from .scheduler import ScrapScheduler, ScrapJob, ScrapJobState
+from .database import DbScrapWriter, DbScrapReader, DbStatReader, DbScrapJobs, ScrapInProgressError, KnownItemsIndex, ImpressionCounter
 from .install import install
+
+# the modules needing requests or Pillow are imported on the first use of their names, not with the package
+_LAZY_NAMES = {
+	"HttpSession": ".session",
+	"create_image_store": ".storage",
+	"VariantGenerator": ".variants",
+	"VariantBackfill": ".variants",
+}
+
+
+def __getattr__(name: str):
+	if name in _LAZY_NAMES:
+		return getattr(importlib.import_module(_LAZY_NAMES[name], __name__), name)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
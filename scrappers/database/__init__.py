@@ -1,4 +1,6 @@
 __version__ = "v0.1"
-__all__ = [ "db_api" ]
+__all__ = [ "db_api", "known_items", "impressions" ]
 
-from .db_api import DbScrapWriter, DbScrapReader, DbStatReader
+from .db_api import DbScrapWriter, DbScrapReader, DbStatReader, DbImpressionWriter, DbItemMaintenance, DbScrapJobs, ScrapInProgressError, close_thread_connections
+from .known_items import KnownItemsIndex
+from .impressions import ImpressionCounter
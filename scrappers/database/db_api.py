@@ -1,9 +1,14 @@
 import typing
 import sqlite3
+import threading
+import os
 import datetime
 import enum
 import pathlib
 from ..util import exception_info, formatters
+from ..util.response_cache import ResponseCache
+from ..util.metrics import Metrics
+from ..timing import ScrapTimings, ScrapPhase
 from ..sources import Source
 
 
@@ -11,12 +16,29 @@ class _Tables(enum.Enum):
 	SCRAP_STAT = "scrap_stat"
 	SCRAP_FAILS = "scrap_fails"
 	SCRAP_ITEMS = "scrap_items"
+	PAGE_VALIDATORS = "page_validators"
+	DAILY_STAT = "scrap_daily_stat"
+	SCRAP_TIMING = "scrap_timing"
+	SCRAP_JOB = "scrap_job"
+
+
+_QUERY_DURATION = Metrics.histogram("scrapper_sqlite_query_duration_seconds", "Duration of the sqlite calls, including the commit.", ("operation", ))
+_SCRAP_ITEMS = Metrics.counter("scrapper_scrap_items_total", "Scrapped items by source and result.", ("source", "result"))
+_SCRAP_BYTES = Metrics.counter("scrapper_scrap_bytes_total", "Bytes of the scrapped items by source.", ("source", ))
+_SCRAPS = Metrics.counter("scrapper_scraps_total", "Finished scraps by source and status.", ("source", "status"))
 
 
 class _ScrapState(enum.Enum):
 	IN_PROGRESS = "in_progress"
 	COMPLETE = "complete"
 	FAILED = "failed"
+	UNCHANGED = "unchanged"
+
+
+class ScrapInProgressError(Exception):
+	def __init__(self, source:str):
+		super().__init__(f"source \"{source}\" is already being scrapped")
+		self.source = source
 
 
 class _SqliteApi(object):
@@ -25,9 +47,44 @@ class _SqliteApi(object):
 	SELECT_LIMIT_MAX = 300
 	SELECT_LIMIT_FALLBACK = 10
 
+	# connection setup, done once per connection
+	JOURNAL_MODE = "wal"
+	SYNCHRONOUS = "normal"
+	BUSY_TIMEOUT_MS = 5000
+
+	# every thread owns its connections (one per datafile), they live until the thread ends or they are closed
+	_thread_local = threading.local()
+
 	def __init__(self, sqlite_datafile:pathlib.Path):
 		self.sqlite_datafile = sqlite_datafile
 
+	@staticmethod
+	def _thread_connections():
+		if not hasattr(_SqliteApi._thread_local, "connections"):
+			_SqliteApi._thread_local.connections = dict()
+		return _SqliteApi._thread_local.connections
+
+	@staticmethod
+	def _open_connection(sqlite_datafile:pathlib.Path):
+		db_conn = sqlite3.connect(sqlite_datafile, timeout=_SqliteApi.BUSY_TIMEOUT_MS / 1000)
+		db_conn.execute(f"pragma journal_mode={_SqliteApi.JOURNAL_MODE}")
+		db_conn.execute(f"pragma synchronous={_SqliteApi.SYNCHRONOUS}")
+		db_conn.execute(f"pragma busy_timeout={_SqliteApi.BUSY_TIMEOUT_MS}")
+		return db_conn
+
+	@staticmethod
+	def close_thread_connections():
+		connections = _SqliteApi._thread_connections()
+		while len(connections) > 0:
+			connections.popitem()[1].close()
+
+	def get_connection(self):
+		connections = _SqliteApi._thread_connections()
+		key = os.fspath(self.sqlite_datafile)
+		if key not in connections:
+			connections[key] = _SqliteApi._open_connection(self.sqlite_datafile)
+		return connections[key]
+
 	@staticmethod
 	def clamp_limit(limit_value:int):
 		if not isinstance(limit_value, int):
@@ -42,12 +99,9 @@ class _SqliteApi(object):
 		return limit_value
 
 	def do_with_connection(self, connection_cb:callable):
-		db_conn = sqlite3.Connection(self.sqlite_datafile)
-		try:
-			with db_conn:
-				return connection_cb(db_conn)
-		finally:
-			db_conn.close()
+		# one transaction per call, committed (or rolled back) by the connection's context manager
+		with self.get_connection() as db_conn:
+			return connection_cb(db_conn)
 
 	def do_with_cursor(self, cursor_cb:callable):
 		def _cursor_call(connection):
@@ -69,7 +123,8 @@ class _SqliteApi(object):
 				result.append(r_mapper(r))
 			return result
 
-		return self.do_with_cursor(_reader)
+		with _QUERY_DURATION.time(operation="read"):
+			return self.do_with_cursor(_reader)
 
 	def compose_and_read(self, source_table:str, joins: str, column_list:list, filter_map:dict, order_tuple_list:tuple, limit:int, row_mapper:callable=None):
 		stmt = f"select {', '.join(column_list)} from {source_table}"
@@ -87,28 +142,67 @@ class _SqliteApi(object):
 
 		return self.read(stmt, filter_map)
 
-	def write(self, table_name, value_mapping:dict):
+	@staticmethod
+	def _insert_stmt(table_name, columns:list):
+		return f"insert into {table_name}({', '.join(columns)}) values (:{', :'.join(columns)})"
+
+	@staticmethod
+	def _update_stmt(table_name, value_mapping:dict, where_condition_mapping:dict):
+		# rename all value_mapping keys to "new_{key}" and where_condition_mapping keys to "where_{key}"
+		# statement pattern:
+		# update table_name set col_a=:new_col_a, col_b=:new_col_b where col_c=:where_col_c and col_d=:where_col_d
+		stmt_set = ", ".join(map(lambda k: f"{k}=:new_{k}", value_mapping.keys()))
+		stmt_whr = " and ".join(map(lambda k: f"{k}=:where_{k}", where_condition_mapping.keys()))
+		sql_stmt = f"update {table_name} set {stmt_set} where {stmt_whr}"
+		return sql_stmt, {
+			**{ f"new_{k}": v for (k, v) in value_mapping.items() },
+			**{ f"where_{k}": v for (k, v) in where_condition_mapping.items() }
+		}
+
+	def write(self, table_name, value_mapping:dict, replace:bool=False):
 		def _writer(connection):
-			cols = list(value_mapping.keys())
-			sql_stmt = f"insert into {table_name}({', '.join(cols)}) values (:{', :'.join(cols)})"
-			connection.execute(sql_stmt, value_mapping)
+			sql_stmt = _SqliteApi._insert_stmt(table_name, list(value_mapping.keys()))
+			if replace:
+				sql_stmt = sql_stmt.replace("insert into", "insert or replace into", 1)
+			return connection.execute(sql_stmt, value_mapping).lastrowid
 
-		return self.do_with_connection(_writer)
+		with _QUERY_DURATION.time(operation="write"):
+			return self.do_with_connection(_writer)
+
+	def execute(self, sql_stmt:str, binds):
+		# any single statement, returns (rowcount, lastrowid)
+		def _writer(connection):
+			db_cursor = connection.execute(sql_stmt, binds)
+			return db_cursor.rowcount, db_cursor.lastrowid
+
+		with _QUERY_DURATION.time(operation="execute"):
+			return self.do_with_connection(_writer)
 
 	def update(self, table_name, value_mapping:dict, where_condition_mapping:dict):
 		def _writer(connection):
-			# rename all value_mapping keys to "new_{key}" and where_condition_mapping keys to "where_{key}"
-			# statement pattern:
-			# update table_name set col_a=:new_col_a, col_b=:new_col_b where col_c=:where_col_c and col_d=:where_col_d
-			stmt_set = ", ".join(map(lambda k: f"{k}=:new_{k}", value_mapping.keys()))
-			stmt_whr = " and ".join(map(lambda k: f"{k}=:where_{k}", where_condition_mapping.keys()))
-			sql_stmt = f"update {table_name} set {stmt_set} where {stmt_whr}"
-			connection.execute(sql_stmt, {
-				**{ f"new_{k}": v for (k, v) in value_mapping.items() },
-				**{ f"where_{k}": v for (k, v) in where_condition_mapping.items() }
-			})
-
-		return self.do_with_connection(_writer)
+			connection.execute(*_SqliteApi._update_stmt(table_name, value_mapping, where_condition_mapping))
+
+		with _QUERY_DURATION.time(operation="update"):
+			return self.do_with_connection(_writer)
+
+	def write_batch(self, inserts:list, updates:list, statements:list=None):
+		# everything in a single transaction
+		# inserts: [(table_name, [value_mapping, ...]), ...], all value mappings of a table must have the same keys
+		# updates: [(table_name, value_mapping, where_condition_mapping), ...]
+		# statements: [(sql_stmt, binds), ...], anything else, executed last
+		def _writer(connection):
+			for (table_name, value_mappings) in inserts:
+				if len(value_mappings) > 0:
+					connection.executemany(_SqliteApi._insert_stmt(table_name, list(value_mappings[0].keys())), value_mappings)
+
+			for (table_name, value_mapping, where_condition_mapping) in updates:
+				connection.execute(*_SqliteApi._update_stmt(table_name, value_mapping, where_condition_mapping))
+
+			for (sql_stmt, binds) in (statements if statements is not None else []):
+				connection.execute(sql_stmt, binds)
+
+		with _QUERY_DURATION.time(operation="write_batch"):
+			return self.do_with_connection(_writer)
 
 	def read_last_seq(self, table_name):
 		def _reader(cursor):
@@ -118,81 +212,243 @@ class _SqliteApi(object):
 		return self.do_with_cursor(_reader)
 
 
+def close_thread_connections():
+	_SqliteApi.close_thread_connections()
+
+
 class DbScrapWriter(object):
+
+	# "in_progress" records older than this are left by crashed scraps, they do not block new ones
+	IN_PROGRESS_STALE_SECONDS = 24 * 3600
+
 	@classmethod
-	def create(cls, sqlite_datafile:pathlib.Path, source:Source):
-		return cls(_SqliteApi(sqlite_datafile), source.value)
+	def create(cls, sqlite_datafile:pathlib.Path, source:Source, batch_size:int=1, batch_interval:float=None, known_items=None, timings:ScrapTimings=None, job_id:int=None, stale_after:float=None):
+		return cls(_SqliteApi(sqlite_datafile), source.value, batch_size, batch_interval, known_items, timings, job_id, stale_after)
 
-	def __init__(self, db_api:_SqliteApi, source:str):
+	def __init__(self, db_api:_SqliteApi, source:str, batch_size:int=1, batch_interval:float=None, known_items=None, timings:ScrapTimings=None, job_id:int=None, stale_after:float=None):
+		# item and fail rows are buffered and written in one transaction once "batch_size" rows are pending
+		# or "batch_interval" seconds passed since the last write, and always on finish
 		self._db = db_api
 		self._source = source
-		self._scrap_stat_id = self._initialize_record()
+		self._job_id = job_id
+		self._stale_after = stale_after if stale_after is not None else DbScrapWriter.IN_PROGRESS_STALE_SECONDS
+		self._batch_size = max(1, batch_size)
+		self._batch_interval = batch_interval
+		self._known_items = known_items
+		self._page_validators = None
+		self._timings = timings if timings is not None else ScrapTimings()
+		self._ts_start = datetime.datetime.now()
+		with self._timings.span(ScrapPhase.DB_WRITE):
+			self._scrap_stat_id = self._initialize_record()
 		self._item_succ_count = 0
 		self._item_fail_count = 0
+		self._byte_count = 0
+		self._pending_items = list()
+		self._pending_fails = list()
+		self._ts_last_flush = datetime.datetime.now()
+
+	@property
+	def scrap_stat_id(self):
+		return self._scrap_stat_id
 
 	def _initialize_record(self):
-		ts_now = datetime.datetime.now()
-		self._db.write(_Tables.SCRAP_STAT.value, {
+		ts_now = self._ts_start
+		columns = {
 			"source": self._source,
 			"ts_start_date": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_now),
 			"ts_start_time": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.TIME_MS, ts_now),
+			"ts_start_us": formatters.ts_to_us(ts_now),
 			"status": _ScrapState.IN_PROGRESS.value,
-		})
-		return self._db.read_last_seq(_Tables.SCRAP_STAT.value)
+			"succ_count": 0,
+			"fail_count": 0,
+			"scrap_job_id": self._job_id,
+		}
+		# other worker processes scrap too, the check and the insert are a single statement, so only one of them gets the source
+		sql_stmt = f"""
+			insert into {_Tables.SCRAP_STAT.value}({', '.join(columns.keys())})
+			select :{', :'.join(columns.keys())}
+			where not exists (
+				select 1 from {_Tables.SCRAP_STAT.value}
+				where source=:source and ts_end_us is null and status=:status and ts_start_us>=:stale_before_us
+			)"""
+		binds = {
+			**columns,
+			"stale_before_us": formatters.ts_to_us(ts_now - datetime.timedelta(seconds=self._stale_after)),
+		}
+
+		# the id of the inserted row, "sqlite_sequence" may already hold the id of a concurrently started scrap
+		(row_count, scrap_stat_id) = self._db.execute(sql_stmt, binds)
+		if row_count == 0:
+			raise ScrapInProgressError(self._source)
+		return scrap_stat_id
 
-	def on_scrap_item_success(self, local_path:pathlib.Path, item_name:str):
+	def on_scrap_item_success(self, local_path:pathlib.Path, item_name:str, byte_count:int=None, content_hash:str=None, variant_paths:dict=None):
 		self._item_succ_count += 1
+		self._byte_count += byte_count if byte_count is not None else 0
+		_SCRAP_ITEMS.inc(source=self._source, result="succeeded")
+		_SCRAP_BYTES.inc(byte_count if byte_count is not None else 0, source=self._source)
 		ts_now = datetime.datetime.now()
-		self._db.write(_Tables.SCRAP_ITEMS.value, {
+		self._pending_items.append({
 			"scrap_stat_id": self._scrap_stat_id,
+			"source": self._source,
 			"ts_date": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_now),
 			"ts_week": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.WEEK, ts_now),
 			"ts_time": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.TIME_MS, ts_now),
+			"ts_us": formatters.ts_to_us(ts_now),
 			"local_path": str(local_path).replace("\\", "/"),
 			"name": item_name,
 			"impressions": 0,
+			"byte_count": byte_count,
+			"content_hash": content_hash,
+			# the variants not made yet are left for the backfill
+			"thumb_path": None if variant_paths is None else variant_paths.get("thumb"),
+			"web_path": None if variant_paths is None else variant_paths.get("web"),
 		})
+		self._flush_if_due(ts_now)
 
 	def on_scrap_item_failure(self, item_name:str, description:str, exception_info:exception_info.ExceptionInfo):
 		self._item_fail_count += 1
+		_SCRAP_ITEMS.inc(source=self._source, result="failed")
 		ts_now = datetime.datetime.now()
-		self._db.write(_Tables.SCRAP_FAILS.value, {
+		self._pending_fails.append({
 			"scrap_stat_id": self._scrap_stat_id,
 			"ts_date": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_now),
 			"ts_time": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.TIME_MS, ts_now),
+			"ts_us": formatters.ts_to_us(ts_now),
 			"item_name": item_name,
 			"description": description,
 			"exc_type": str(exception_info.exception_type),
 			"exc_value": str(exception_info.value),
 			"exc_traceback": str(exception_info.formatted_exception),
 		})
+		self._flush_if_due(ts_now)
+
+	def _flush_if_due(self, ts_now:datetime.datetime):
+		if len(self._pending_items) + len(self._pending_fails) >= self._batch_size:
+			self.flush()
+		elif self._batch_interval is not None and (ts_now - self._ts_last_flush).total_seconds() >= self._batch_interval:
+			self.flush()
+
+	def flush(self, scrap_stat_values:dict=None, statements:list=None):
+		# the counts in "scrap_stat" are written together with the rows they count,
+		# so after a crash the record is still consistent (just left "in_progress")
+		with self._timings.span(ScrapPhase.DB_WRITE):
+			self._flush(scrap_stat_values, statements)
+
+	def _flush(self, scrap_stat_values:dict, statements:list):
+		self._db.write_batch([
+			(_Tables.SCRAP_ITEMS.value, self._pending_items),
+			(_Tables.SCRAP_FAILS.value, self._pending_fails),
+		], [
+			(_Tables.SCRAP_STAT.value, {
+				"succ_count": self._item_succ_count,
+				"fail_count": self._item_fail_count,
+				**(scrap_stat_values if scrap_stat_values is not None else {}),
+			}, {
+				"scrap_stat_id": self._scrap_stat_id,
+			}),
+		], statements)
+
+		if self._known_items is not None:
+			for item in self._pending_items:
+				self._known_items.add(item["name"], item["ts_us"])
+
+		self._pending_items = list()
+		self._pending_fails = list()
+		self._ts_last_flush = datetime.datetime.now()
+
+	def on_page_validators(self, page_validators:dict):
+		self._page_validators = page_validators
+
+	def _daily_stat_upsert(self, status:_ScrapState, ts_end:datetime.datetime):
+		# the rollup of the day (the scrap started on) is updated in the transaction that ends the scrap
+		columns = {
+			"source": self._source,
+			"day": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, self._ts_start),
+			"scrap_count": 1,
+			"complete_count": 1 if status == _ScrapState.COMPLETE else 0,
+			"unchanged_count": 1 if status == _ScrapState.UNCHANGED else 0,
+			"failed_count": 1 if status == _ScrapState.FAILED else 0,
+			"succ_count": self._item_succ_count,
+			"fail_count": self._item_fail_count,
+			"byte_count": self._byte_count,
+			"duration_us": formatters.ts_to_us(ts_end) - formatters.ts_to_us(self._ts_start),
+		}
+		counters = [k for k in columns.keys() if k not in ("source", "day")]
+		sql_stmt = _SqliteApi._insert_stmt(_Tables.DAILY_STAT.value, list(columns.keys()))
+		sql_stmt += " on conflict(source, day) do update set " + ", ".join(f"{k}={k} + excluded.{k}" for k in counters)
+		return sql_stmt, columns
+
+	def _timing_insert(self):
+		# the phases are written with the record that ends the scrap, so the final write is not counted in
+		def _us(seconds):
+			return int(seconds * 1_000_000) if seconds is not None else None
+
+		durations = self._timings.durations
+		columns = {
+			"scrap_stat_id": self._scrap_stat_id,
+			**{ f"{phase.value}_us": _us(durations[phase]) for phase in ScrapPhase },
+			"item_count": self._timings.item_count,
+			"byte_count": self._timings.byte_count,
+			**{ f"latency_p{p}_us": _us(self._timings.latency_percentile(p)) for p in ScrapTimings.LATENCY_PERCENTILES },
+			"latency_max_us": _us(self._timings.latency_max),
+		}
+		return _SqliteApi._insert_stmt(_Tables.SCRAP_TIMING.value, list(columns.keys())), columns
 
 	def finish(self):
 		ts_now = datetime.datetime.now()
-		self._db.update(_Tables.SCRAP_STAT.value, {
+		self.flush({
 			"ts_end_date": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_now),
 			"ts_end_time": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.TIME_MS, ts_now),
+			"ts_end_us": formatters.ts_to_us(ts_now),
 			"status": _ScrapState.COMPLETE.value,
-			"succ_count": self._item_succ_count,
-			"fail_count": self._item_fail_count,
-		}, {
-			"scrap_stat_id": self._scrap_stat_id,
-		})
+		}, [self._daily_stat_upsert(_ScrapState.COMPLETE, ts_now), self._timing_insert()])
+		_SCRAPS.inc(source=self._source, status=_ScrapState.COMPLETE.value)
+		ResponseCache.invalidate(self._source)
+
+		# with failed items, the page has to be fetched (and the items retried) next time
+		if self._item_fail_count == 0:
+			self._write_page_validators(ts_now)
+
+	def finish_unchanged(self):
+		ts_now = datetime.datetime.now()
+		self.flush({
+			"ts_end_date": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_now),
+			"ts_end_time": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.TIME_MS, ts_now),
+			"ts_end_us": formatters.ts_to_us(ts_now),
+			"status": _ScrapState.UNCHANGED.value,
+		}, [self._daily_stat_upsert(_ScrapState.UNCHANGED, ts_now), self._timing_insert()])
+		_SCRAPS.inc(source=self._source, status=_ScrapState.UNCHANGED.value)
+		ResponseCache.invalidate(self._source)
+
+		# the same content may come with new validators, the next request has to send them to be answered by 304
+		self._write_page_validators(ts_now)
+
+	def _write_page_validators(self, ts_now:datetime.datetime):
+		if self._page_validators is None:
+			return
+
+		self._db.write(_Tables.PAGE_VALIDATORS.value, {
+			"source": self._source,
+			"etag": self._page_validators.get("etag"),
+			"last_modified": self._page_validators.get("last_modified"),
+			"content_hash": self._page_validators.get("content_hash"),
+			"ts_us": formatters.ts_to_us(ts_now),
+		}, replace=True)
 
 	def finish_exceptionaly(self, exception_info:exception_info.ExceptionInfo):
 		ts_now = datetime.datetime.now()
-		self._db.update(_Tables.SCRAP_STAT.value, {
+		self.flush({
 			"ts_end_date": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, ts_now),
 			"ts_end_time": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.TIME_MS, ts_now),
+			"ts_end_us": formatters.ts_to_us(ts_now),
 			"status": _ScrapState.FAILED.value,
-			"succ_count": self._item_succ_count,
-			"fail_count": self._item_fail_count,
 			"exc_type": str(exception_info.exception_type),
 			"exc_value": str(exception_info.value),
 			"exc_traceback": str(exception_info.formatted_exception),
-		}, {
-			"scrap_stat_id": self._scrap_stat_id,
-		})
+		}, [self._daily_stat_upsert(_ScrapState.FAILED, ts_now), self._timing_insert()])
+		_SCRAPS.inc(source=self._source, status=_ScrapState.FAILED.value)
+		ResponseCache.invalidate(self._source)
 
 
 class DbScrapReader(object):
@@ -204,24 +460,64 @@ class DbScrapReader(object):
 		self._db = db_api
 		self._source = source
 
-	def read_recent_items(self, item_limit:int):
-		def _row_mapper(r):
-			scrap_ts = formatters.str_to_ts(formatters.TIMESTAMP_FORMAT.DATETIME_MS, f"{r[0]} {r[1]}")
-			return {
-				"datetime": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATETIME, scrap_ts),
-				"age": formatters.ts_diff_to_str(scrap_ts, datetime.datetime.now(), False),
-				"name": r[2],
-				"local_path": r[3],
-				"impressions": r[4],
-			}
+	@staticmethod
+	def cursor_of(ts_us:int, scrap_item_id:int):
+		return f"{ts_us}-{scrap_item_id}"
+
+	@staticmethod
+	def parse_cursor(cursor:str):
+		# raises ValueError for a malformed cursor
+		ts_us, scrap_item_id = cursor.split("-")
+		return int(ts_us), int(scrap_item_id)
+
+	# columns read by _item_row_mapper
+	ITEM_COLUMNS = "ts_us, name, local_path, impressions, thumb_path, web_path, scrap_item_id"
+
+	@staticmethod
+	def _item_row_mapper(r):
+		scrap_ts = formatters.us_to_ts(r[0])
+		return {
+			"item_id": r[6],
+			"datetime": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATETIME, scrap_ts),
+			"ts_us": r[0],
+			"age": formatters.ts_diff_to_str(scrap_ts, datetime.datetime.now(), False),
+			"name": r[1],
+			"local_path": r[2],
+			"impressions": r[3],
+			"thumb_path": r[4] if r[4] is not None else r[2],
+			"web_path": r[5] if r[5] is not None else r[2],
+			"cursor": DbScrapReader.cursor_of(r[0], r[6]),
+		}
+
+	def read_recent_items(self, item_limit:int, before:str=None):
+		# keyset pagination, "before" is the cursor of the last item of the previous page
+		# (the items are sorted by (ts_us, scrap_item_id), so the page is read straight from the index at any depth)
+		binds = {
+			"source": self._source,
+			"limit": _SqliteApi.clamp_limit(item_limit)
+		}
+
+		where_before = ""
+		if before is not None:
+			binds["before_ts_us"], binds["before_item_id"] = DbScrapReader.parse_cursor(before)
+			where_before = "and (ts_us, scrap_item_id) < (:before_ts_us, :before_item_id)"
 
 		stmt = f"""
-			select ts_date, ts_time, name, local_path, impressions
+			select {DbScrapReader.ITEM_COLUMNS}
 			from {_Tables.SCRAP_ITEMS.value}
-			inner join {_Tables.SCRAP_STAT.value}
-				on {_Tables.SCRAP_STAT.value}.scrap_stat_id={_Tables.SCRAP_ITEMS.value}.scrap_stat_id
-			where source=:source
-			order by ts_date desc, ts_time desc
+			where source=:source {where_before}
+			order by ts_us desc, scrap_item_id desc
+			limit :limit"""
+
+		return self._db.read(stmt, binds, DbScrapReader._item_row_mapper)
+
+	def read_most_viewed_items(self, item_limit:int):
+		# read in order from the (source, impressions) index
+		stmt = f"""
+			select {DbScrapReader.ITEM_COLUMNS}
+			from {_Tables.SCRAP_ITEMS.value}
+			where source=:source and impressions > 0
+			order by impressions desc, scrap_item_id desc
 			limit :limit"""
 
 		binds = {
@@ -229,38 +525,96 @@ class DbScrapReader(object):
 			"limit": _SqliteApi.clamp_limit(item_limit)
 		}
 
-		return self._db.read(stmt, binds, _row_mapper)
+		return self._db.read(stmt, binds, DbScrapReader._item_row_mapper)
 
-	def read_recent_item_names(self):
+	def read_recent_item_names(self, window_days:int=183):
+		# straight from the (source, ts_us) index, the items carry their source
 		stmt = f"""
 			select distinct name
 			from {_Tables.SCRAP_ITEMS.value}
-			inner join {_Tables.SCRAP_STAT.value}
-				on {_Tables.SCRAP_STAT.value}.scrap_stat_id={_Tables.SCRAP_ITEMS.value}.scrap_stat_id
-			where source=:source and scrap_items.ts_date > date('now', '-6 month')
+			where source=:source and ts_us > :since_us
 			"""
 
 		binds = {
 			"source": self._source,
+			"since_us": formatters.ts_to_us(datetime.datetime.now() - datetime.timedelta(days=window_days)),
 		}
 
 		return self._db.read(stmt, binds, lambda r: r[0])
 
+	def read_page_validators(self):
+		stmt = f"""
+			select etag, last_modified, content_hash
+			from {_Tables.PAGE_VALIDATORS.value}
+			where source=:source
+			"""
+
+		binds = {
+			"source": self._source,
+		}
+
+		rows = self._db.read(stmt, binds, lambda r: { "etag": r[0], "last_modified": r[1], "content_hash": r[2] })
+		return rows[0] if len(rows) > 0 else None
+
+	def read_item_names_after(self, last_item_id:int, since_us:int):
+		stmt = f"""
+			select scrap_item_id, name, ts_us
+			from {_Tables.SCRAP_ITEMS.value}
+			where source=:source and scrap_item_id > :last_item_id and ts_us > :since_us
+			"""
+
+		binds = {
+			"source": self._source,
+			"last_item_id": last_item_id,
+			"since_us": since_us,
+		}
+
+		return self._db.read(stmt, binds)
+
 
 class DbStatReader(object):
 	@classmethod
 	def create(cls, sqlite_datafile:pathlib.Path):
 		return cls(_SqliteApi(sqlite_datafile))
 
+	# the "scrap_timing" columns, in microseconds except of the counts
+	TIMING_COLUMNS = (
+		*(f"{phase.value}_us" for phase in ScrapPhase),
+		"item_count",
+		"byte_count",
+		*(f"latency_p{p}_us" for p in ScrapTimings.LATENCY_PERCENTILES),
+		"latency_max_us",
+	)
+
 	def __init__(self, db_api:_SqliteApi):
 		self._db = db_api
 
-	def read_last_scraps(self, record_limit:int):
-		def _to_ts_safe(date_string, time_string):
-			try:
-				return formatters.str_to_ts(formatters.TIMESTAMP_FORMAT.DATETIME_MS, f"{date_string} {time_string}")
-			except:
-				return None
+	@staticmethod
+	def _scrap_stmt(where_clause:str):
+		return f"""
+			select
+				s.{_Tables.SCRAP_STAT.value}_id,
+				s.source,
+				s.status,
+				s.ts_start_us,
+				s.ts_end_us,
+				s.succ_count,
+				s.fail_count,
+				s.exc_type,
+				s.exc_value,
+				s.exc_traceback,
+				{", ".join(f"t.{column}" for column in DbStatReader.TIMING_COLUMNS)}
+			from {_Tables.SCRAP_STAT.value} s
+			left join {_Tables.SCRAP_TIMING.value} t on t.{_Tables.SCRAP_STAT.value}_id = s.{_Tables.SCRAP_STAT.value}_id
+			{where_clause}
+			order by s.{_Tables.SCRAP_STAT.value}_id desc
+			limit :limit
+			"""
+
+	@staticmethod
+	def _scrap_row_mapper(row):
+		def _to_ts_safe(ts_us):
+			return None if ts_us is None else formatters.us_to_ts(ts_us)
 
 		def _percent_str_safe(succ_count, fail_count):
 			try:
@@ -268,47 +622,221 @@ class DbStatReader(object):
 			except:
 				return formatters.NOT_AVAILABLE_STR
 
-		def _mapper(row):
-			scrap_s = _to_ts_safe(*row[3:5])
-			scrap_e = _to_ts_safe(*row[5:7])
-			return {
-				"scrap_id": row[0],
-				"source": row[1],
-				"status": row[2],
-				"ts_start": formatters.NOT_AVAILABLE_STR if scrap_s is None else formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATETIME, scrap_s),
-				"ts_end": formatters.NOT_AVAILABLE_STR if scrap_e is None else formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATETIME, scrap_e),
-				"age": formatters.NOT_AVAILABLE_STR if scrap_s is None else formatters.ts_diff_to_str(scrap_s, datetime.datetime.now(), False),
-				"time_taken": formatters.NOT_AVAILABLE_STR if None in (scrap_s, scrap_e) else formatters.ts_diff_to_str(scrap_s, scrap_e, False),
-				"count_succ": row[7],
-				"count_fail": row[8],
-				"succ_percentage": _percent_str_safe(row[7], row[8]),
-				"exc_type": row[9],
-				"exc_value": row[10],
-				"exc_traceback": row[11],
-			}
+		def _timings(values):
+			# None for the scraps recorded before the timings were
+			if values[DbStatReader.TIMING_COLUMNS.index("item_count")] is None:
+				return None
+			timings = dict()
+			for column, value in zip(DbStatReader.TIMING_COLUMNS, values):
+				if column.endswith("_us"):
+					timings[column[:-len("_us")]] = formatters.us_to_duration_str(value)
+				elif column == "byte_count":
+					timings["size"] = formatters.size_str(value)
+				else:
+					timings[column] = value
+			return timings
+
+		scrap_s = _to_ts_safe(row[3])
+		scrap_e = _to_ts_safe(row[4])
+		return {
+			"scrap_id": row[0],
+			"source": row[1],
+			"status": row[2],
+			"ts_start": formatters.NOT_AVAILABLE_STR if scrap_s is None else formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATETIME, scrap_s),
+			"ts_end": formatters.NOT_AVAILABLE_STR if scrap_e is None else formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATETIME, scrap_e),
+			"ts_start_us": row[3],
+			"age": formatters.NOT_AVAILABLE_STR if scrap_s is None else formatters.ts_diff_to_str(scrap_s, datetime.datetime.now(), False),
+			"time_taken": formatters.NOT_AVAILABLE_STR if None in (scrap_s, scrap_e) else formatters.ts_diff_to_str(scrap_s, scrap_e, False),
+			"count_succ": row[5],
+			"count_fail": row[6],
+			"succ_percentage": _percent_str_safe(row[5], row[6]),
+			"exc_type": row[7],
+			"exc_value": row[8],
+			"exc_traceback": row[9],
+			"timings": _timings(row[10:]),
+		}
 
+	def read_last_scraps(self, record_limit:int):
+		binds = {
+			"limit": _SqliteApi.clamp_limit(record_limit),
+		}
+
+		return self._db.read(DbStatReader._scrap_stmt(""), binds, DbStatReader._scrap_row_mapper)
+
+	@staticmethod
+	def _rollup_row_mapper(row):
+		# row: source, (day), scrap_count, complete_count, unchanged_count, failed_count, succ_count, fail_count, byte_count, duration_us
+		(scrap_count, complete_count, unchanged_count, failed_count, succ_count, fail_count, byte_count, duration_us) = row[-8:]
+		return {
+			"source": row[0],
+			"scrap_count": scrap_count,
+			"complete_count": complete_count,
+			"unchanged_count": unchanged_count,
+			"failed_count": failed_count,
+			"scrap_succ_percentage": formatters.percentage_str(scrap_count - failed_count, scrap_count),
+			"count_succ": succ_count,
+			"count_fail": fail_count,
+			"succ_percentage": formatters.percentage_str(succ_count, succ_count + fail_count),
+			"size": formatters.size_str(byte_count),
+			"avg_time_taken": formatters.NOT_AVAILABLE_STR if scrap_count == 0 else formatters.td_format(datetime.timedelta(microseconds=duration_us // scrap_count), False),
+		}
+
+	def read_daily_stats(self, day_count:int):
+		# the rollups of the last "day_count" days, the newest first
+		stmt = f"""
+			select source, day, scrap_count, complete_count, unchanged_count, failed_count, succ_count, fail_count, byte_count, duration_us
+			from {_Tables.DAILY_STAT.value}
+			where day >= :since_day
+			order by day desc, source
+			"""
+
+		binds = {
+			"since_day": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, datetime.datetime.now() - datetime.timedelta(days=day_count - 1)),
+		}
+
+		return self._db.read(stmt, binds, lambda r: { **DbStatReader._rollup_row_mapper(r), "day": r[1] })
+
+	def read_source_totals(self, day_count:int):
+		# per source sums of the rollups of the last "day_count" days
+		stmt = f"""
+			select source, sum(scrap_count), sum(complete_count), sum(unchanged_count), sum(failed_count), sum(succ_count), sum(fail_count), sum(byte_count), sum(duration_us)
+			from {_Tables.DAILY_STAT.value}
+			where day >= :since_day
+			group by source
+			order by source
+			"""
+
+		binds = {
+			"since_day": formatters.ts_to_str(formatters.TIMESTAMP_FORMAT.DATE, datetime.datetime.now() - datetime.timedelta(days=day_count - 1)),
+		}
+
+		return self._db.read(stmt, binds, DbStatReader._rollup_row_mapper)
+
+	def read_version(self, source:Source=None):
+		# (the latest scrap id, the latest end of a scrap) of the source (or of all the sources),
+		# changes with every started and finished scrap
+		# a lone max() each, so both are read from the end of an index instead of scanning the table
+		where_clause = "" if source is None else "where source=:source"
 		stmt = f"""
 			select
-				{_Tables.SCRAP_STAT.value}_id,
-				source,
-				status,
-				ts_start_date,
-				ts_start_time,
-				ts_end_date,
-				ts_end_time,
-				succ_count,
-				fail_count,
-				exc_type,
-				exc_value,
-				exc_traceback
-			from {_Tables.SCRAP_STAT.value}
-			order by {_Tables.SCRAP_STAT.value}_id desc
-			limit :limit
+				(select max(scrap_stat_id) from {_Tables.SCRAP_STAT.value} {where_clause}),
+				(select max(ts_end_us) from {_Tables.SCRAP_STAT.value} {where_clause})
 			"""
+		binds = dict() if source is None else { "source": source.value }
+
+		return self._db.read(stmt, binds)[0]
 
+	def read_scrap(self, scrap_stat_id:int):
 		binds = {
-			"limit": _SqliteApi.clamp_limit(record_limit),
+			"scrap_stat_id": scrap_stat_id,
+			"limit": 1,
 		}
 
-		return self._db.read(stmt, binds, _mapper)
-		
+		rows = self._db.read(DbStatReader._scrap_stmt(f"where s.{_Tables.SCRAP_STAT.value}_id=:scrap_stat_id"), binds, DbStatReader._scrap_row_mapper)
+		return rows[0] if len(rows) > 0 else None
+
+
+class DbScrapJobs(object):
+	@classmethod
+	def create(cls, sqlite_datafile:pathlib.Path):
+		return cls(_SqliteApi(sqlite_datafile))
+
+	def __init__(self, db_api:_SqliteApi):
+		self._db = db_api
+
+	def add(self, sources:list, ts_queued:datetime.datetime):
+		return self._db.write(_Tables.SCRAP_JOB.value, {
+			"sources": ",".join(s.value for s in sources),
+			"ts_queued_us": formatters.ts_to_us(ts_queued),
+		})
+
+	def on_job_started(self, job_id:int, ts_started:datetime.datetime):
+		self._db.update(_Tables.SCRAP_JOB.value, {"ts_started_us": formatters.ts_to_us(ts_started)}, {"scrap_job_id": job_id})
+
+	def on_job_finished(self, job_id:int, ts_finished:datetime.datetime, errors:list):
+		self._db.update(_Tables.SCRAP_JOB.value, {
+			"ts_finished_us": formatters.ts_to_us(ts_finished),
+			"errors": "\n".join(str(e) for e in errors) if len(errors) > 0 else None,
+		}, {
+			"scrap_job_id": job_id,
+		})
+
+	def read_job(self, job_id:int):
+		# the job with the records of its scraps, by source value (None until the scrap of the source starts)
+		rows = self._db.read(f"""
+			select sources, ts_queued_us, ts_started_us, ts_finished_us, errors
+			from {_Tables.SCRAP_JOB.value}
+			where scrap_job_id=:scrap_job_id
+			""", {"scrap_job_id": job_id})
+		if len(rows) == 0:
+			return None
+
+		(sources, ts_queued_us, ts_started_us, ts_finished_us, errors) = rows[0]
+		source_values = sources.split(",") if len(sources) > 0 else []
+		binds = {
+			"scrap_job_id": job_id,
+			"limit": _SqliteApi.SELECT_LIMIT_MAX,
+		}
+		scraps = { r["source"]: r for r in reversed(self._db.read(DbStatReader._scrap_stmt("where s.scrap_job_id=:scrap_job_id"), binds, DbStatReader._scrap_row_mapper)) }
+		return {
+			"job_id": job_id,
+			"ts_queued": formatters.us_to_ts(ts_queued_us),
+			"ts_started": None if ts_started_us is None else formatters.us_to_ts(ts_started_us),
+			"ts_finished": None if ts_finished_us is None else formatters.us_to_ts(ts_finished_us),
+			"scraps": { s: scraps.get(s) for s in source_values },
+			"errors": errors.split("\n") if errors is not None else [],
+		}
+
+	def read_last_starts(self):
+		# source value -> the start of its latest scrap (by any worker process)
+		stmt = f"select source, max(ts_start_us) from {_Tables.SCRAP_STAT.value} group by source"
+		return { source: formatters.us_to_ts(ts_us) for (source, ts_us) in self._db.read(stmt, {}) if ts_us is not None }
+
+
+class DbImpressionWriter(object):
+	@classmethod
+	def create(cls, sqlite_datafile:pathlib.Path):
+		return cls(_SqliteApi(sqlite_datafile))
+
+	def __init__(self, db_api:_SqliteApi):
+		self._db = db_api
+
+	def add_impressions(self, impression_counts:dict):
+		# impression_counts: scrap_item_id -> views to add, all in a single transaction
+		def _writer(connection):
+			connection.executemany(
+				f"update {_Tables.SCRAP_ITEMS.value} set impressions=coalesce(impressions, 0) + :count where scrap_item_id=:scrap_item_id",
+				[{ "scrap_item_id": item_id, "count": count } for (item_id, count) in impression_counts.items()])
+
+		return self._db.do_with_connection(_writer)
+
+
+class DbItemMaintenance(object):
+	# bulk fixes of the stored items, used by the offline migrations
+	@classmethod
+	def create(cls, sqlite_datafile:pathlib.Path):
+		return cls(_SqliteApi(sqlite_datafile))
+
+	def __init__(self, db_api:_SqliteApi):
+		self._db = db_api
+
+	def read_item_paths(self):
+		stmt = f"select scrap_item_id, local_path, thumb_path, web_path from {_Tables.SCRAP_ITEMS.value} where local_path is not null order by scrap_item_id"
+		return self._db.read(stmt, {})
+
+	def read_items_without_variants(self, variants:list, item_limit:int):
+		# the newest first, they are the most likely to be viewed
+		# the first condition is the one of the partial index (the variants are some of these columns), only the items left are read
+		stmt = f"""
+			select scrap_item_id, local_path
+			from {_Tables.SCRAP_ITEMS.value}
+			where (thumb_path is null or web_path is null) and local_path is not null and ({' or '.join(f'{variant}_path is null' for variant in variants)})
+			order by ts_us desc
+			limit :limit"""
+
+		return self._db.read(stmt, { "limit": _SqliteApi.clamp_limit(item_limit) })
+
+	def update_items(self, item_values:list):
+		# item_values: [(scrap_item_id, value_mapping), ...]
+		updates = [(_Tables.SCRAP_ITEMS.value, value_mapping, { "scrap_item_id": scrap_item_id }) for (scrap_item_id, value_mapping) in item_values]
+		return self._db.write_batch([], updates)
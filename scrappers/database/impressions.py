@@ -0,0 +1,79 @@
+import threading
+import collections
+import os
+import pathlib
+from .db_api import _SqliteApi, DbImpressionWriter, close_thread_connections
+
+
+class ImpressionCounter(object):
+	# views of the items, counted in memory and written by a background thread in a single batched update,
+	# so the requests never write, one counter per datafile shared by the whole process
+
+	_counters = dict()
+	_counters_lock = threading.Lock()
+
+	@classmethod
+	def get(cls, sqlite_datafile:pathlib.Path, flush_interval:float=10.0):
+		key = os.fspath(sqlite_datafile)
+		with cls._counters_lock:
+			if key not in cls._counters:
+				cls._counters[key] = cls(DbImpressionWriter(_SqliteApi(sqlite_datafile)), flush_interval)
+			return cls._counters[key]
+
+	def __init__(self, writer:DbImpressionWriter, flush_interval:float):
+		self._writer = writer
+		self._flush_interval = flush_interval
+		self._lock = threading.Lock()
+		self._pending = collections.Counter()
+		self._stop_event = threading.Event()
+		self._thread = None
+
+	def add(self, scrap_item_ids:list):
+		with self._lock:
+			self._pending.update(scrap_item_ids)
+
+	def pending_count(self):
+		with self._lock:
+			return sum(self._pending.values())
+
+	def flush(self):
+		with self._lock:
+			pending, self._pending = self._pending, collections.Counter()
+
+		if len(pending) == 0:
+			return 0
+
+		try:
+			self._writer.add_impressions(pending)
+		except:
+			# counted again with the next flush
+			with self._lock:
+				self._pending.update(pending)
+			raise
+
+		return len(pending)
+
+	def start(self):
+		if self._thread is not None:
+			return
+
+		self._stop_event.clear()
+		self._thread = threading.Thread(target=self._loop, name="impression-counter", daemon=True)
+		self._thread.start()
+
+	def stop(self):
+		self._stop_event.set()
+		if self._thread is not None:
+			self._thread.join()
+			self._thread = None
+
+	def _loop(self):
+		try:
+			while not self._stop_event.wait(self._flush_interval):
+				try:
+					self.flush()
+				except:
+					pass
+			self.flush()
+		finally:
+			close_thread_connections()
@@ -0,0 +1,71 @@
+import threading
+import datetime
+import os
+import pathlib
+from ..util import formatters
+from ..sources import Source
+from .db_api import _SqliteApi, DbScrapReader
+
+
+class KnownItemsIndex(object):
+	# names of the items scrapped within the window, one index per (datafile, source) shared by the whole process
+
+	_indexes = dict()
+	_indexes_lock = threading.Lock()
+
+	@classmethod
+	def get(cls, sqlite_datafile:pathlib.Path, source:Source, window_days:int):
+		key = (os.fspath(sqlite_datafile), source.value)
+		with cls._indexes_lock:
+			if key not in cls._indexes:
+				cls._indexes[key] = cls(_SqliteApi(sqlite_datafile), source.value, window_days)
+			index = cls._indexes[key]
+
+		index.set_window_days(window_days)
+		return index
+
+	def __init__(self, db_api:_SqliteApi, source:str, window_days:int):
+		self._reader = DbScrapReader(db_api, source)
+		self._window = datetime.timedelta(days=window_days)
+		self._lock = threading.Lock()
+		self._items = dict()
+		self._last_item_id = 0
+		self._ts_last_prune = datetime.datetime.now()
+
+	def set_window_days(self, window_days:int):
+		self._window = datetime.timedelta(days=window_days)
+
+	def _since_us(self):
+		return formatters.ts_to_us(datetime.datetime.now() - self._window)
+
+	def refresh(self):
+		# the first refresh loads the whole window, the next ones only the rows added since (by any process)
+		rows = self._reader.read_item_names_after(self._last_item_id, self._since_us())
+
+		with self._lock:
+			for (item_id, name, ts_us) in rows:
+				self._add(name, ts_us)
+				self._last_item_id = max(self._last_item_id, item_id)
+
+			if (datetime.datetime.now() - self._ts_last_prune) > datetime.timedelta(days=1):
+				since_us = self._since_us()
+				self._items = {name: ts_us for (name, ts_us) in self._items.items() if ts_us > since_us}
+				self._ts_last_prune = datetime.datetime.now()
+
+	def add(self, name:str, ts_us:int=None):
+		with self._lock:
+			self._add(name, ts_us if ts_us is not None else formatters.ts_to_us())
+
+	def _add(self, name:str, ts_us:int):
+		if ts_us is not None and ts_us > self._items.get(name, 0):
+			self._items[name] = ts_us
+
+	def contains(self, name:str):
+		ts_us = self._items.get(name)
+		return ts_us is not None and ts_us > self._since_us()
+
+	def __contains__(self, name:str):
+		return self.contains(name)
+
+	def __len__(self):
+		return len(self._items)
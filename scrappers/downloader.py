@@ -0,0 +1,84 @@
+import os, pathlib
+import datetime
+import tempfile
+import hashlib
+from .session import HttpSession
+
+
+class DownloadError(Exception):
+	pass
+
+
+class DownloadInfo(object):
+	def __init__(self, temp_file: pathlib.Path, byte_count: int, content_hash: str, content_type: str):
+		self._temp_file = temp_file
+		self._byte_count = byte_count
+		self._content_hash = content_hash
+		self._content_type = content_type
+
+	def __str__(self):
+		return f"{self.byte_count=}, {self.content_hash=}, {self.content_type=}"
+
+	@property
+	def temp_file(self):
+		return self._temp_file
+
+	@property
+	def byte_count(self):
+		return self._byte_count
+
+	@property
+	def content_hash(self):
+		return self._content_hash
+
+	@property
+	def content_type(self):
+		return self._content_type
+
+
+class ImageDownloader(object):
+
+	CHUNK_SIZE = 64 * 1024
+	ALLOWED_CONTENT_TYPES = ("image/", )
+
+	def __init__(self, session: HttpSession, max_size: int=None):
+		self._session = session
+		self._max_size = max_size
+
+	def download(self, url: str, temp_directory: pathlib.Path, deadline: datetime.datetime=None):
+		# streamed into a temporary file (flushed to the disk), which the image store then moves into its place,
+		# so a failed download never leaves a truncated file behind
+		with self._session.get(url, deadline=deadline, stream=True) as r:
+			r.raise_for_status()
+
+			content_type = r.headers.get("Content-Type")
+			if content_type is not None and not content_type.lower().startswith(ImageDownloader.ALLOWED_CONTENT_TYPES):
+				raise DownloadError(f"unexpected content type '{content_type}' of {url}")
+
+			content_length = r.headers.get("Content-Length")
+			if self._max_size is not None and content_length is not None and content_length.isdigit() and int(content_length) > self._max_size:
+				raise DownloadError(f"{url} is too big ({content_length} bytes, limit is {self._max_size})")
+
+			fd, temp_name = tempfile.mkstemp(dir=temp_directory, suffix=".part")
+			try:
+				byte_count = 0
+				content_hash = hashlib.sha256()
+
+				with os.fdopen(fd, "wb") as f:
+					for chunk in r.iter_content(ImageDownloader.CHUNK_SIZE):
+						byte_count += len(chunk)
+						if self._max_size is not None and byte_count > self._max_size:
+							raise DownloadError(f"{url} is too big (over {self._max_size} bytes)")
+
+						content_hash.update(chunk)
+						f.write(chunk)
+
+					f.flush()
+					os.fsync(f.fileno())
+
+			except:
+				if os.path.exists(temp_name):
+					os.unlink(temp_name)
+				raise
+
+		return DownloadInfo(pathlib.Path(temp_name), byte_count, content_hash.hexdigest(), content_type)
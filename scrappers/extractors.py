@@ -0,0 +1,163 @@
+import re
+import html
+import urllib.parse
+import bs4, chardet
+
+
+class LinkExtractor(object):
+	# extracts the query value "query_key" of all the "a" links having "href_needle" in the path
+	def __init__(self, href_needle: str, query_key: str="file"):
+		self._href_needle = href_needle
+		self._query_key = query_key
+
+	def extract(self, chunks, encoding: str=None):
+		# without the "encoding", the page is decoded as chardet guesses it (the charset sent by the server is often missing or wrong)
+		raise NotImplementedError()
+
+	@staticmethod
+	def _detect_encoding(content: bytes):
+		return chardet.detect(content)["encoding"] or "utf-8"
+
+	def _value_of(self, href: str):
+		url = urllib.parse.urlparse(href)
+		if not isinstance(url.path, str) or self._href_needle not in url.path:
+			return None
+
+		qs = urllib.parse.parse_qs(url.query)
+		return qs.get(self._query_key).pop() if self._query_key in qs else None
+
+
+class StreamingLinkExtractor(LinkExtractor):
+	# scans the bytes as they arrive, no document tree is built
+	# the "a" tags are found the way html.parser (used by bs4) finds them: comments and the content of "script" and "style" are skipped,
+	# attribute values may hold ">", and the "href" is a whole attribute name (the last one wins)
+
+	# everything that starts with "<" and has to be seen whole
+	MARKUP_PATTERN = re.compile(rb"""
+		<!--.*?--\s*>
+		| <(script|style)(?=[\s/>])(?:[^>"']|"[^"]*"|'[^']*')*>.*?</\s*\1\s*>
+		| <a(?=[\s/])((?:[^>"']|"[^"]*"|'[^']*')*)>
+		""", re.IGNORECASE | re.DOTALL | re.VERBOSE)
+
+	# the start of the markup above, the match waits for more data when only this is there
+	MARKUP_START_PATTERN = re.compile(rb"<(?:!--|script(?=[\s/>])|style(?=[\s/>])|a(?=[\s/]))", re.IGNORECASE)
+	MARKUP_START_MAX_LENGTH = len(b"<script ")
+
+	ATTRIBUTE_PATTERN = re.compile(rb"""((?<=['"\s/])[^\s/>][^\s/=>]*)(?:\s*=+\s*('[^']*'|"[^"]*"|(?!['"])[^>\s]*))?""")
+
+	# without the "encoding", it is sniffed from this much of the start of the page, and only once a link is not plain ascii
+	SNIFF_MAX_LENGTH = 64 * 1024
+
+	def extract(self, chunks, encoding: str=None):
+		# each link is yielded as soon as its tag is complete, the links waiting for the sniffed encoding keep their order
+		head = bytearray()
+		hrefs = list()
+		waiting = list()
+		pending = b""
+
+		for chunk in chunks:
+			if encoding is None and len(head) < StreamingLinkExtractor.SNIFF_MAX_LENGTH:
+				head.extend(chunk[:StreamingLinkExtractor.SNIFF_MAX_LENGTH - len(head)])
+
+			pending += chunk
+			# nothing new can end before the next ">"
+			if b">" in chunk or len(pending) == len(chunk):
+				pending = pending[self._scan(pending, hrefs, False):]
+
+			if len(hrefs) == 0 and (len(waiting) == 0 or len(head) < StreamingLinkExtractor.SNIFF_MAX_LENGTH):
+				continue
+
+			(encoding, values) = self._decode_hrefs(hrefs, waiting, encoding, head, False)
+			yield from values
+
+		self._scan(pending, hrefs, True)
+		(encoding, values) = self._decode_hrefs(hrefs, waiting, encoding, head, True)
+		yield from values
+
+	def _decode_hrefs(self, hrefs: list, waiting: list, encoding: str, head: bytearray, exhausted: bool):
+		# moves the raw "hrefs" to "waiting" and returns the values of those that can be decoded now, with the encoding known by then
+		waiting.extend(hrefs)
+		hrefs.clear()
+
+		if encoding is None and any(not href.isascii() for href in waiting):
+			if not exhausted and len(head) < StreamingLinkExtractor.SNIFF_MAX_LENGTH:
+				# plain ascii is the same in any encoding chardet may come up with, it does not wait for the sniff
+				ready = 0
+				while waiting[ready].isascii():
+					ready += 1
+				values = self._values_of(waiting[:ready], "ascii")
+				del waiting[:ready]
+				return (encoding, values)
+			encoding = LinkExtractor._detect_encoding(bytes(head))
+
+		values = self._values_of(waiting, encoding if encoding is not None else "ascii")
+		waiting.clear()
+		return (encoding, values)
+
+	def _values_of(self, hrefs: list, encoding: str):
+		values = list()
+		for href in hrefs:
+			value = self._value_of(html.unescape(href.decode(encoding, errors="replace")))
+			if value is not None:
+				values.append(value)
+		return values
+
+	def _scan(self, data: bytes, hrefs: list, final: bool):
+		# appends the raw "href" values found in "data", returns where the unfinished rest of it starts
+		pos = 0
+		while True:
+			lt = data.find(b"<", pos)
+			if lt < 0:
+				return len(data)
+
+			m = StreamingLinkExtractor.MARKUP_PATTERN.match(data, lt)
+			if m is not None:
+				if m.group(2) is not None:
+					href = self._href_of(m.group(2))
+					if href is not None:
+						hrefs.append(href)
+				pos = m.end()
+				continue
+
+			start = StreamingLinkExtractor.MARKUP_START_PATTERN.match(data, lt)
+			if not final and (start is not None or len(data) - lt < StreamingLinkExtractor.MARKUP_START_MAX_LENGTH):
+				return lt
+
+			# an unclosed comment (or script) hides the rest of the page, as it does for html.parser
+			if start is not None and not start.group(0).lower().startswith(b"<a"):
+				return len(data)
+
+			pos = lt + 1
+
+	def _href_of(self, attributes: bytes):
+		href = None
+		# the lookbehind of the attribute name needs the separator before the first one
+		for m in StreamingLinkExtractor.ATTRIBUTE_PATTERN.finditer(b" " + attributes):
+			if m.group(1).lower() == b"href":
+				value = m.group(2) if m.group(2) is not None else b""
+				href = value[1:-1] if value[:1] in (b"'", b'"') else value
+		return href
+
+
+class Bs4LinkExtractor(LinkExtractor):
+	# the whole page is parsed into a tree, slow but forgiving
+
+	def extract(self, chunks, encoding: str=None):
+		content = b"".join(chunks)
+		_encoding = encoding if encoding is not None else LinkExtractor._detect_encoding(content)
+		soup = bs4.BeautifulSoup(content.decode(_encoding, errors="replace"), features="html.parser")
+
+		for a in soup.find_all("a"):
+			value = self._value_of(a.get("href"))
+			if value is not None:
+				yield value
+
+
+EXTRACTORS = {
+	"streaming": StreamingLinkExtractor,
+	"bs4": Bs4LinkExtractor,
+}
+
+
+def create_extractor(name: str, href_needle: str):
+	return EXTRACTORS.get(name, StreamingLinkExtractor)(href_needle)
@@ -1,14 +1,7 @@
 from .sources import Source
 from .settings import Settings
-from .impl import Noop, Roumen, RoumenMaso
+from .registry import SourceRegistry
 
 
 def create(source:Source, settings:Settings):
-	scrapper_classes = {
-		Source.NOOP: Noop,
-		Source.ROUMEN: Roumen,
-		Source.ROUMEN_MASO: RoumenMaso,
-	}
-
-	scrapper_class = scrapper_classes.get(source, Noop)
-	return scrapper_class(settings)
+	return SourceRegistry.create(source, settings)
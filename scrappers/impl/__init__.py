@@ -1,4 +1,3 @@
 __all__ = [ "noop", "roumen" ]
 
-from .noop import Noop
-from .roumen import Roumen, RoumenMaso
+# the implementations are imported by the SourceRegistry on the first use, not with the package
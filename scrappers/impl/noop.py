@@ -1,12 +1,13 @@
+import datetime
 from ..sources import Source
 from ..settings import Settings
 from ..result import Result
 
 class Noop(object):
-	def __init__(self, settings: Settings):
-		pass
+	def __init__(self, source: Source, settings: Settings):
+		self._source = source
 
-	def scrap(self):
-		result = Result(Source.NOOP)
+	def scrap(self, result: Result=None, deadline: datetime.datetime=None):
+		result = result if result is not None else Result(self._source)
 		result.on_scrapping_finished()
 		return result
@@ -1,11 +1,20 @@
 import sys, typing, traceback
 import datetime, os, pathlib
-import requests, urllib, bs4
+import time
+import concurrent.futures
+import hashlib
 import sqlite3
 from ..sources import Source
 from ..settings import Settings
 from ..result import Result, ResultItem, ExceptionInfo
-from ..database import DbScrapWriter, DbScrapReader
+from ..session import HttpSession
+from ..politeness import CircuitOpenError
+from ..extractors import create_extractor
+from ..downloader import ImageDownloader
+from ..storage import create_image_store
+from ..variants import VariantGenerator
+from ..timing import ScrapTimings, ScrapPhase
+from ..database import DbScrapWriter, DbScrapReader, KnownItemsIndex
 
 
 class _RoumenSettings(object):
@@ -22,37 +31,81 @@ class BaseRoumen(object):
 			"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:81.0) Gecko/20100101 Firefox/81.0",
 	}
 
+	DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 	def __init__(self, source: Source, settings: Settings, roumen_settings: _RoumenSettings):
 		self._settings = settings
 		self._source = source
 		self._roumen_settings = roumen_settings
+		self._session = HttpSession.shared(settings, BaseRoumen.REQUEST_HEADERS)
+		self._downloader = ImageDownloader(self._session, settings.max_image_size)
+		self._image_store = create_image_store(settings.image_store, settings.scrap_path)
+		self._variants = VariantGenerator(settings.scrap_path, settings.image_variants)
 
-	def scrap(self):
+	def scrap(self, result: Result=None, deadline: datetime.datetime=None):
 		ts = datetime.datetime.now()
-		result = Result(self._source, ts)
-		scrap_writer = DbScrapWriter.create(self._settings.sqlite_datafile, self._source)
+		result = result if result is not None else Result(self._source, ts)
+		known_items = KnownItemsIndex.get(self._settings.sqlite_datafile, self._source, self._settings.dedup_window_days)
+		timings = result.timings
+		# a scrap ends by its deadline (and the grace period after it), its record is surely stale after twice the timeout
+		stale_after = None if self._settings.scrap_timeout is None else 2 * self._settings.scrap_timeout
+		scrap_writer = DbScrapWriter.create(self._settings.sqlite_datafile, self._source, self._settings.db_write_batch_size, self._settings.db_write_batch_interval, known_items, timings, result.job_id, stale_after)
+		result.on_scrapping_started(scrap_writer.scrap_stat_id)
 
 		try:
-			for image_to_download in self._get_images_to_download():
-				# path will be like "{scrap_path}/{source}/{yyyy}/{week}/{image.jpg}"
-				relative_path = pathlib.Path(self._source.value).joinpath(f"{ts:%Y}").joinpath(f"{ts:%V}")
-				destination_path = self._settings.scrap_path / relative_path
-
-				try:
-					destination_path.mkdir(parents=True, exist_ok=True)
-					relative_file_path = relative_path / image_to_download
-
-					remote_file_url = f"{self._roumen_settings.img_base}/{image_to_download}"
-					# r = requests.get(remote_file_url, headers=Roumen.REQUEST_HEADERS)
-					urllib.request.urlretrieve(remote_file_url, filename=str(destination_path / image_to_download))
-
-					result.on_item(ResultItem.createSucceeded(relative_file_path, remote_file_url))
-					scrap_writer.on_scrap_item_success(relative_file_path, image_to_download)
-
-				except:
-					e_info = ExceptionInfo.createFromLastException()
-					result.on_item(ResultItem.createFailed(image_to_download, e_info))
-					scrap_writer.on_scrap_item_failure(item_name=image_to_download, description="scrap failure", exception_info=e_info)
+			if deadline is not None and datetime.datetime.now() >= deadline:
+				# e.g. the other sources took the whole time before the scrap of this one started
+				raise TimeoutError("deadline exceeded before the index page was fetched")
+
+			images_to_download = self._get_images_to_download(known_items, scrap_writer, timings, deadline)
+			if images_to_download is None:
+				# the index page did not change since the last complete scrap
+				scrap_writer.finish_unchanged()
+				return result
+
+			executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._settings.download_workers)
+			try:
+				# downloads run concurrently, but the results are collected in the original order (the "top" image last)
+				downloads = [(image, executor.submit(self._download_image, ts, image, timings, deadline)) for image in images_to_download]
+				circuit_open = None
+
+				for image_to_download, download in downloads:
+					try:
+						timeout = None if deadline is None else max(0.0, (deadline - datetime.datetime.now()).total_seconds())
+						relative_file_path, remote_file_url, download_info, variant_paths = download.result(timeout=timeout)
+						result.on_item(ResultItem.createSucceeded(relative_file_path, remote_file_url))
+						scrap_writer.on_scrap_item_success(relative_file_path, image_to_download, download_info.byte_count, download_info.content_hash, variant_paths)
+
+					except CircuitOpenError as e:
+						# the host keeps failing, the downloads not started yet are cancelled (and recorded as failures),
+						# the results collected by then are recorded as usual and the scrap fails with the breaker's error
+						if circuit_open is None:
+							circuit_open = (e, ExceptionInfo.createFromLastException())
+							for (_, pending_download) in downloads:
+								pending_download.cancel()
+						result.on_item(ResultItem.createFailed(image_to_download, circuit_open[1]))
+						scrap_writer.on_scrap_item_failure(item_name=image_to_download, description="host circuit open", exception_info=circuit_open[1])
+
+					except:
+						e_info = ExceptionInfo.createFromLastException()
+						if download.cancelled():
+							# cancelled when the circuit of the host opened
+							result.on_item(ResultItem.createFailed(image_to_download, circuit_open[1]))
+							scrap_writer.on_scrap_item_failure(item_name=image_to_download, description="host circuit open", exception_info=circuit_open[1])
+							continue
+
+						# past the deadline, the pending downloads are cancelled (and recorded as failures) one by one
+						description = "scrap failure" if download.done() else "deadline exceeded"
+						download.cancel()
+						result.on_item(ResultItem.createFailed(image_to_download, e_info))
+						scrap_writer.on_scrap_item_failure(item_name=image_to_download, description=description, exception_info=e_info)
+
+				if circuit_open is not None:
+					raise circuit_open[0]
+
+			finally:
+				# the downloads still running past the deadline are not waited for, their items are already recorded as failed
+				executor.shutdown(wait=deadline is None or datetime.datetime.now() < deadline, cancel_futures=True)
 
 			scrap_writer.finish()
 
@@ -66,45 +119,97 @@ class BaseRoumen(object):
 
 		return result
 
-	def _get_images_to_download(self):
-		remote_image_names = self._scrap_image_names()
-		stored_image_names = DbScrapReader.create(self._settings.sqlite_datafile, self._source).read_recent_item_names()
-		images_to_download = [name for name in remote_image_names if name not in stored_image_names]
+	def _download_image(self, ts: datetime.datetime, image_to_download: str, timings: ScrapTimings, deadline: datetime.datetime=None):
+		remote_file_url = f"{self._roumen_settings.img_base}/{image_to_download}"
+		ts_start = time.perf_counter()
+		with timings.span(ScrapPhase.DOWNLOAD):
+			download_info = self._downloader.download(remote_file_url, self._image_store.temp_path, deadline)
+			relative_file_path = self._image_store.put(download_info, self._source, ts, image_to_download)
+		timings.on_item_downloaded(time.perf_counter() - ts_start, download_info.byte_count)
+
+		# post-download processing, still in the download worker
+		with timings.span(ScrapPhase.VARIANTS):
+			variant_paths = self._variants.generate(relative_file_path)
+
+		return relative_file_path, remote_file_url, download_info, variant_paths
+
+	def _get_images_to_download(self, known_items: KnownItemsIndex, scrap_writer: DbScrapWriter, timings: ScrapTimings=None, deadline: datetime.datetime=None):
+		timings = timings if timings is not None else ScrapTimings()
+		with timings.span(ScrapPhase.DB_READ):
+			page_validators = DbScrapReader.create(self._settings.sqlite_datafile, self._source).read_page_validators()
+		remote_image_names, new_page_validators = self._scrap_image_names(page_validators, timings, deadline)
+		if remote_image_names is None:
+			# the content is the same, the validators need not be (e.g. a new etag after the page was regenerated)
+			if new_page_validators != (page_validators if page_validators is not None else {}):
+				scrap_writer.on_page_validators(new_page_validators)
+			return None
+
+		scrap_writer.on_page_validators(new_page_validators)
+		with timings.span(ScrapPhase.DEDUP):
+			known_items.refresh()
+			images_to_download = [name for name in remote_image_names if name not in known_items]
 
 		# remove possible duplicates with preserved order and then reverse, because the "top" image should be scrapped last
 		seen = set()
 		seen_add = seen.add
 		return reversed([_ for _ in images_to_download if not (_ in seen or seen_add(_))])
 
-	def _scrap_image_names(self):
-		r = requests.get(self._roumen_settings.base_url, params=self._roumen_settings.base_url_params)
-		soup = bs4.BeautifulSoup(r.content.decode(r.apparent_encoding), features="html.parser")
-
-		# extract all "a" tags having "roumingShow.php" present in the "href"
-		all_urls = map(lambda a: urllib.parse.urlparse(a.get("href")), soup.find_all("a"))
-		all_show = [url for url in all_urls if isinstance(url.path,str) and self._roumen_settings.href_needle in url.path]
-
-		# extract all "file" values from the query string
-		all_qstr = [urllib.parse.parse_qs(url.query) for url in all_show]
-		all_imgs = [qs.get("file").pop() for qs in all_qstr if "file" in qs]
-
-		return all_imgs
-
-
-class Roumen(BaseRoumen):
-	def __init__(self, settings: Settings):
-		super().__init__(Source.ROUMEN, settings, _RoumenSettings(
-			base_url="https://www.rouming.cz",
-			base_url_params={},
-			img_base="https://www.rouming.cz/upload",
-			href_needle="roumingShow.php"
-		))
-
-class RoumenMaso(BaseRoumen):
-	def __init__(self, settings: Settings):
-		super().__init__(Source.ROUMEN_MASO, settings, _RoumenSettings(
-			base_url="https://www.roumenovomaso.cz",
-			base_url_params={"agree":"on"},
-			img_base="https://www.roumenovomaso.cz/upload",
-			href_needle="masoShow.php"
+	def _scrap_image_names(self, page_validators: dict=None, timings: ScrapTimings=None, deadline: datetime.datetime=None):
+		# conditional request, the validators come from the last complete scrap
+		# returns (None, page_validators) when the page did not change
+		timings = timings if timings is not None else ScrapTimings()
+		stored_validators = page_validators if page_validators is not None else {}
+		request_headers = dict()
+		if stored_validators.get("etag") is not None:
+			request_headers["If-None-Match"] = stored_validators["etag"]
+		if stored_validators.get("last_modified") is not None:
+			request_headers["If-Modified-Since"] = stored_validators["last_modified"]
+
+		with timings.span(ScrapPhase.INDEX_FETCH):
+			r = self._session.get(self._roumen_settings.base_url, params=self._roumen_settings.base_url_params, headers=request_headers, deadline=deadline, stream=True)
+
+		with r:
+			if r.status_code == 304:
+				return None, stored_validators
+
+			r.raise_for_status()
+
+			# the page is hashed while the extractor consumes it, waiting for the chunks counts as the fetch, the rest as the parse
+			content_hash = hashlib.sha256()
+			chunks = r.iter_content(BaseRoumen.DOWNLOAD_CHUNK_SIZE)
+			def _hashed_chunks():
+				while True:
+					with timings.span(ScrapPhase.INDEX_FETCH):
+						chunk = next(chunks, None)
+					if chunk is None:
+						return
+					content_hash.update(chunk)
+					yield chunk
+
+			ts_parse_start = time.perf_counter()
+			fetch_before_parse = timings.duration(ScrapPhase.INDEX_FETCH)
+			extractor = create_extractor(self._settings.link_extractor, self._roumen_settings.href_needle)
+			# not "r.encoding", which is ISO-8859-1 whenever the server sends no charset
+			all_imgs = list(extractor.extract(_hashed_chunks()))
+			timings.add(ScrapPhase.PARSE, time.perf_counter() - ts_parse_start - (timings.duration(ScrapPhase.INDEX_FETCH) - fetch_before_parse))
+
+		page_validators = {
+			"etag": r.headers.get("ETag"),
+			"last_modified": r.headers.get("Last-Modified"),
+			"content_hash": content_hash.hexdigest(),
+		}
+		if page_validators["content_hash"] == stored_validators.get("content_hash"):
+			return None, page_validators
+
+		return all_imgs, page_validators
+
+
+class LinkPatternScrapper(BaseRoumen):
+	# any site listing its images as links "{href_needle}?file={name}" on "base_url", downloaded from "{img_base}/{name}"
+	def __init__(self, source: Source, settings: Settings, base_url: str, img_base: str, href_needle: str, base_url_params: dict=None):
+		super().__init__(source, settings, _RoumenSettings(
+			base_url=base_url,
+			base_url_params=base_url_params if base_url_params is not None else {},
+			img_base=img_base,
+			href_needle=href_needle
 		))
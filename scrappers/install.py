@@ -1,7 +1,7 @@
 import sqlite3
 
-def install(sql_connection: sqlite3.Connection):
-	c = sql_connection.cursor()
+
+def _create_tables(c: sqlite3.Cursor):
 	c.execute("""
 		create table if not exists scrap_stat (
 			scrap_stat_id integer primary key autoincrement,
@@ -42,4 +42,223 @@ def install(sql_connection: sqlite3.Connection):
 			foreign key(scrap_stat_id) references scrap_stat(scrap_stat_id)
 		);	""")
 
-	c.close()
+
+def _add_scrap_stat_exception_columns(c: sqlite3.Cursor):
+	# older datafiles got these columns by hand
+	_add_columns(c, "scrap_stat", [
+		("exc_type", "text"),
+		("exc_value", "text"),
+		("exc_traceback", "text"),
+	])
+
+
+def _create_indexes(c: sqlite3.Cursor):
+	c.execute("create index if not exists scrap_stat_source_idx on scrap_stat(source);")
+	c.execute("create index if not exists scrap_fails_scrap_stat_id_idx on scrap_fails(scrap_stat_id);")
+	c.execute("create index if not exists scrap_items_scrap_stat_id_idx on scrap_items(scrap_stat_id);")
+	c.execute("create index if not exists scrap_items_ts_idx on scrap_items(ts_date desc, ts_time desc);")
+	c.execute("create index if not exists scrap_items_name_idx on scrap_items(name);")
+	# give the query planner statistics to choose between the indexes
+	c.execute("analyze;")
+
+
+def _add_epoch_timestamps(c: sqlite3.Cursor):
+	# sortable microseconds since the epoch, next to the "{date} {HH:MM.SS,ffffff}" text columns
+	_add_columns(c, "scrap_stat", [("ts_start_us", "integer"), ("ts_end_us", "integer")])
+	_add_columns(c, "scrap_fails", [("ts_us", "integer")])
+	_add_columns(c, "scrap_items", [("ts_us", "integer")])
+
+	def _to_us(date_column, time_column):
+		# "HH:MM.SS,ffffff" -> "HH:MM:SS" seconds + "ffffff" microseconds
+		time_hms = f"substr({time_column}, 1, 2) || ':' || substr({time_column}, 4, 2) || ':' || substr({time_column}, 7, 2)"
+		return f"(strftime('%s', {date_column} || ' ' || {time_hms}) * 1000000 + cast(substr({time_column}, 10) as integer))"
+
+	c.execute(f"update scrap_stat set ts_start_us={_to_us('ts_start_date', 'ts_start_time')}, ts_end_us={_to_us('ts_end_date', 'ts_end_time')};")
+	c.execute(f"update scrap_fails set ts_us={_to_us('ts_date', 'ts_time')};")
+	c.execute(f"update scrap_items set ts_us={_to_us('ts_date', 'ts_time')};")
+
+	c.execute("drop index if exists scrap_items_ts_idx;")
+	c.execute("create index if not exists scrap_items_ts_us_idx on scrap_items(ts_us);")
+	c.execute("analyze;")
+
+
+def _create_page_validators(c: sqlite3.Cursor):
+	# validators of the index page seen by the last complete scrap of the source
+	c.execute("""
+		create table if not exists page_validators (
+			source text primary key,
+			etag text,
+			last_modified text,
+			content_hash text,
+			ts_us integer
+		);	""")
+
+
+def _add_scrap_item_content_columns(c: sqlite3.Cursor):
+	_add_columns(c, "scrap_items", [
+		("byte_count", "integer"),
+		("content_hash", "text"),
+	])
+
+
+def _add_scrap_item_variant_columns(c: sqlite3.Cursor):
+	# downscaled variants, null until made (the original path when not worth making)
+	_add_columns(c, "scrap_items", [
+		("thumb_path", "text"),
+		("web_path", "text"),
+	])
+
+
+def _add_scrap_item_source(c: sqlite3.Cursor):
+	# copied from "scrap_stat", so the items of a source are read in order straight from the index
+	_add_columns(c, "scrap_items", [("source", "text")])
+	c.execute("update scrap_items set source=(select source from scrap_stat where scrap_stat.scrap_stat_id=scrap_items.scrap_stat_id);")
+	# "scrap_item_id" is the rowid, which every index ends with
+	c.execute("create index if not exists scrap_items_source_ts_us_idx on scrap_items(source, ts_us);")
+	c.execute("analyze;")
+
+
+def _create_impressions_index(c: sqlite3.Cursor):
+	c.execute("update scrap_items set impressions=0 where impressions is null;")
+	c.execute("create index if not exists scrap_items_source_impressions_idx on scrap_items(source, impressions);")
+	c.execute("analyze;")
+
+
+def _create_daily_stat(c: sqlite3.Cursor):
+	# per source and day (of the scrap start) rollups of the finished scraps, kept up to date by DbScrapWriter
+	c.execute("""
+		create table if not exists scrap_daily_stat (
+			source text,
+			day text,
+			scrap_count integer,
+			complete_count integer,
+			unchanged_count integer,
+			failed_count integer,
+			succ_count integer,
+			fail_count integer,
+			byte_count integer,
+			duration_us integer,
+			primary key(source, day)
+		);	""")
+	c.execute("create index if not exists scrap_daily_stat_day_idx on scrap_daily_stat(day);")
+
+	c.execute("""
+		insert or replace into scrap_daily_stat
+		select
+			source,
+			ts_start_date,
+			count(*),
+			sum(status = 'complete'),
+			sum(status = 'unchanged'),
+			sum(status = 'failed'),
+			sum(coalesce(succ_count, 0)),
+			sum(coalesce(fail_count, 0)),
+			sum(coalesce((select sum(byte_count) from scrap_items where scrap_items.scrap_stat_id=scrap_stat.scrap_stat_id), 0)),
+			sum(coalesce(ts_end_us - ts_start_us, 0))
+		from scrap_stat
+		where status != 'in_progress' and ts_start_date is not null
+		group by source, ts_start_date;""")
+
+
+def _create_scrap_timing(c: sqlite3.Cursor):
+	# per phase durations and download latencies of a scrap, written when the scrap ends
+	c.execute("""
+		create table if not exists scrap_timing (
+			scrap_stat_id integer primary key,
+			index_fetch_us integer,
+			parse_us integer,
+			dedup_us integer,
+			download_us integer,
+			variants_us integer,
+			db_write_us integer,
+			item_count integer,
+			byte_count integer,
+			latency_p50_us integer,
+			latency_p90_us integer,
+			latency_p99_us integer,
+			latency_max_us integer
+		);	""")
+
+
+def _create_scrap_jobs(c: sqlite3.Cursor):
+	# jobs of the scheduler, in the datafile so every worker process can tell the status of any of them
+	c.execute("""
+		create table if not exists scrap_job (
+			scrap_job_id integer primary key autoincrement,
+			sources text,
+			ts_queued_us integer,
+			ts_started_us integer,
+			ts_finished_us integer,
+			errors text
+		);	""")
+	_add_columns(c, "scrap_stat", [("scrap_job_id", "integer")])
+	c.execute("create index if not exists scrap_stat_scrap_job_id_idx on scrap_stat(scrap_job_id);")
+
+
+def _create_scrap_stat_end_index(c: sqlite3.Cursor):
+	# the latest end of a scrap (of a source) is the version of the cached pages, read on every request
+	c.execute("create index if not exists scrap_stat_source_ts_end_us_idx on scrap_stat(source, ts_end_us);")
+	c.execute("create index if not exists scrap_stat_ts_end_us_idx on scrap_stat(ts_end_us);")
+	c.execute("analyze;")
+
+
+def _add_scrap_timing_db_read(c: sqlite3.Cursor):
+	# null for the scraps timed before it was a phase of its own
+	_add_columns(c, "scrap_timing", [("db_read_us", "integer")])
+
+
+def _create_missing_variants_index(c: sqlite3.Cursor):
+	# the items the variant backfill still has to do, newest first, without scanning the ones done
+	c.execute("create index if not exists scrap_items_missing_variants_idx on scrap_items(ts_us) where thumb_path is null or web_path is null;")
+	c.execute("analyze;")
+
+
+def _add_columns(c: sqlite3.Cursor, table_name: str, columns: list):
+	existing_columns = [row[1] for row in c.execute(f"pragma table_info({table_name});")]
+	for (column_name, column_type) in columns:
+		if column_name not in existing_columns:
+			c.execute(f"alter table {table_name} add column {column_name} {column_type};")
+
+
+# schema version N is reached by applying the first N migrations, never change or reorder the released ones
+MIGRATIONS = [
+	_create_tables,
+	_add_scrap_stat_exception_columns,
+	_create_indexes,
+	_add_epoch_timestamps,
+	_create_page_validators,
+	_add_scrap_item_content_columns,
+	_add_scrap_item_variant_columns,
+	_add_scrap_item_source,
+	_create_impressions_index,
+	_create_daily_stat,
+	_create_scrap_timing,
+	_create_scrap_jobs,
+	_create_scrap_stat_end_index,
+	_add_scrap_timing_db_read,
+	_create_missing_variants_index,
+]
+
+
+def schema_version(sql_connection: sqlite3.Connection):
+	return sql_connection.execute("pragma user_version;").fetchone()[0]
+
+
+def install(sql_connection: sqlite3.Connection):
+	# brings the datafile up to date, the schema version is kept in "pragma user_version"
+	version = schema_version(sql_connection)
+
+	for (migration_version, migration) in enumerate(MIGRATIONS[version:], start=version + 1):
+		c = sql_connection.cursor()
+		try:
+			c.execute("begin;")
+			migration(c)
+			c.execute(f"pragma user_version = {migration_version};")
+			c.execute("commit;")
+		except:
+			c.execute("rollback;")
+			raise
+		finally:
+			c.close()
+
+	return schema_version(sql_connection)
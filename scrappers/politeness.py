@@ -0,0 +1,158 @@
+import threading
+import time
+import enum
+
+
+class CircuitOpenError(Exception):
+	# the host failed too many times in a row, it is not asked again until "retry_at" (time.monotonic)
+	def __init__(self, host: str, failure_count: int, retry_at: float):
+		super().__init__(f"circuit breaker of {host} is open after {failure_count} failures in a row, retry in {max(0.0, retry_at - time.monotonic()):.0f}s")
+		self._host = host
+		self._failure_count = failure_count
+		self._retry_at = retry_at
+
+	@property
+	def host(self):
+		return self._host
+
+	@property
+	def failure_count(self):
+		return self._failure_count
+
+	@property
+	def retry_at(self):
+		return self._retry_at
+
+
+class TokenBucket(object):
+	# "rate" requests per second on average, up to "burst" at once
+	def __init__(self, rate: float, burst: int=1):
+		self._rate = rate
+		self._burst = max(1, burst)
+		self._tokens = float(self._burst)
+		self._ts_last = time.monotonic()
+		self._lock = threading.Lock()
+
+	def _reserve(self):
+		# takes a token (possibly one not refilled yet), returns the seconds to wait for it
+		with self._lock:
+			ts_now = time.monotonic()
+			self._tokens = min(float(self._burst), self._tokens + (ts_now - self._ts_last) * self._rate)
+			self._ts_last = ts_now
+			self._tokens -= 1.0
+			return 0.0 if self._tokens >= 0.0 else -self._tokens / self._rate
+
+	def acquire(self):
+		if self._rate is None or self._rate <= 0:
+			return 0.0
+
+		wait = self._reserve()
+		if wait > 0:
+			time.sleep(wait)
+		return wait
+
+
+class CircuitState(enum.Enum):
+	CLOSED = "closed"
+	OPEN = "open"
+	HALF_OPEN = "half_open"
+
+
+class CircuitBreaker(object):
+	# opens after "failure_threshold" failures in a row, after "reset_timeout" seconds one request (the probe) is let through,
+	# its success closes the breaker again, its failure opens it for another "reset_timeout"
+	def __init__(self, host: str, failure_threshold: int, reset_timeout: float):
+		self._host = host
+		self._failure_threshold = failure_threshold
+		self._reset_timeout = reset_timeout
+		self._state = CircuitState.CLOSED
+		self._failure_count = 0
+		self._ts_opened = None
+		self._probe_pending = False
+		self._lock = threading.Lock()
+
+	@property
+	def state(self):
+		with self._lock:
+			return self._state
+
+	def check(self):
+		# raises CircuitOpenError when the request should not be made
+		if self._failure_threshold is None:
+			return
+
+		with self._lock:
+			if self._state == CircuitState.CLOSED:
+				return
+
+			retry_at = self._ts_opened + self._reset_timeout
+			if self._state == CircuitState.OPEN and time.monotonic() >= retry_at:
+				self._state = CircuitState.HALF_OPEN
+				self._probe_pending = False
+
+			if self._state == CircuitState.HALF_OPEN and not self._probe_pending:
+				self._probe_pending = True
+				return
+
+			raise CircuitOpenError(self._host, self._failure_count, retry_at)
+
+	def on_success(self):
+		with self._lock:
+			self._state = CircuitState.CLOSED
+			self._failure_count = 0
+			self._probe_pending = False
+
+	def on_failure(self):
+		if self._failure_threshold is None:
+			return
+
+		with self._lock:
+			self._failure_count += 1
+			if self._state == CircuitState.HALF_OPEN or self._failure_count >= self._failure_threshold:
+				self._state = CircuitState.OPEN
+				self._ts_opened = time.monotonic()
+				self._probe_pending = False
+
+
+class HostPoliteness(object):
+	# the rate limit and the circuit breaker of a host, shared by all the scrappers (and sessions) talking to it
+
+	_hosts = dict()
+	_hosts_lock = threading.Lock()
+
+	@classmethod
+	def get(cls, host: str, rate: float, burst: int, failure_threshold: int, reset_timeout: float):
+		# the first caller sets the limits of the host
+		with cls._hosts_lock:
+			if host not in cls._hosts:
+				cls._hosts[host] = cls(host, rate, burst, failure_threshold, reset_timeout)
+			return cls._hosts[host]
+
+	@classmethod
+	def reset(cls):
+		with cls._hosts_lock:
+			cls._hosts.clear()
+
+	def __init__(self, host: str, rate: float, burst: int, failure_threshold: int, reset_timeout: float):
+		self._host = host
+		self._bucket = TokenBucket(rate, burst)
+		self._breaker = CircuitBreaker(host, failure_threshold, reset_timeout)
+
+	@property
+	def host(self):
+		return self._host
+
+	@property
+	def breaker(self):
+		return self._breaker
+
+	def before_request(self):
+		# the breaker is asked first, a request that will not be made does not take a token
+		self._breaker.check()
+		self._bucket.acquire()
+
+	def on_success(self):
+		self._breaker.on_success()
+
+	def on_failure(self):
+		self._breaker.on_failure()
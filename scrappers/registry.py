@@ -0,0 +1,140 @@
+import threading
+import importlib
+import importlib.metadata
+from .sources import Source
+from .settings import Settings
+
+
+class SourceSpec(object):
+	# how to make the scrapper of a source: "loader" is "module:attribute" (imported on the first use) or a callable,
+	# called as loader(source, settings, **options)
+	def __init__(self, source: Source, loader, title: str=None, options: dict=None, interval: float=None):
+		self._source = source
+		self._loader = loader
+		self._title = title if title is not None else source.value
+		self._options = options if options is not None else {}
+		self._interval = interval
+		self._factory = None if isinstance(loader, str) else loader
+
+	@property
+	def source(self):
+		return self._source
+
+	@property
+	def title(self):
+		return self._title
+
+	@property
+	def options(self):
+		return self._options
+
+	@property
+	def interval(self):
+		return self._interval
+
+	def _load(self):
+		if self._factory is None:
+			module_name, _, attribute = self._loader.partition(":")
+			factory = importlib.import_module(module_name)
+			for name in attribute.split("."):
+				factory = getattr(factory, name)
+			self._factory = factory
+		return self._factory
+
+	def create(self, settings: Settings):
+		return self._load()(self._source, settings, **self._options)
+
+
+class SourceRegistry(object):
+	# the sources of the process, in the order of registration (the navigation follows it)
+	# registered from the config (see "register_config"), from the entry points of the installed packages and the built-in ones
+
+	ENTRY_POINT_GROUP = "scrappers.sources"
+
+	# the "scrapper" of a config, the declarative ones are "link-pattern"
+	SCRAPPERS = {
+		"link-pattern": "scrappers.impl.roumen:LinkPatternScrapper",
+		"noop": "scrappers.impl.noop:Noop",
+	}
+
+	# the keys of a config that are not passed to the scrapper
+	CONFIG_KEYS = ("source", "title", "scrapper", "interval")
+
+	BUILTIN_SOURCES = [
+		{
+			"source": Source.ROUMEN.value,
+			"base-url": "https://www.rouming.cz",
+			"img-base": "https://www.rouming.cz/upload",
+			"href-needle": "roumingShow.php",
+		},
+		{
+			"source": Source.ROUMEN_MASO.value,
+			"base-url": "https://www.roumenovomaso.cz",
+			"base-url-params": {"agree": "on"},
+			"img-base": "https://www.roumenovomaso.cz/upload",
+			"href-needle": "masoShow.php",
+		},
+	]
+
+	_specs = dict()
+	_lock = threading.Lock()
+
+	@classmethod
+	def register(cls, spec: SourceSpec):
+		# a source registered again is replaced (in its original place)
+		with cls._lock:
+			cls._specs[spec.source] = spec
+		return spec
+
+	@classmethod
+	def register_config(cls, config: dict):
+		# e.g. { "source": "roumen", "title": "roumen", "base-url": ..., "base-url-params": {...}, "img-base": ..., "href-needle": ... }
+		# "scrapper" is a key of SCRAPPERS or "module:attribute" ("link-pattern" by default), the other keys are its options
+		scrapper = config.get("scrapper", "link-pattern")
+		options = { k.replace("-", "_"): v for (k, v) in config.items() if k not in SourceRegistry.CONFIG_KEYS }
+		return cls.register(SourceSpec(
+			source=Source.named(config["source"]),
+			loader=SourceRegistry.SCRAPPERS.get(scrapper, scrapper),
+			title=config.get("title"),
+			options=options,
+			interval=config.get("interval"),
+			))
+
+	@classmethod
+	def configure(cls, configs: list):
+		for config in configs:
+			cls.register_config(config)
+
+	@classmethod
+	def load_entry_points(cls):
+		# an entry point "{source value} = module:attribute" of the group ENTRY_POINT_GROUP, loaded on the first scrap
+		entry_points = importlib.metadata.entry_points()
+		group = entry_points.select(group=SourceRegistry.ENTRY_POINT_GROUP) if hasattr(entry_points, "select") else entry_points.get(SourceRegistry.ENTRY_POINT_GROUP, [])
+		for entry_point in group:
+			cls.register(SourceSpec(Source.named(entry_point.name), entry_point.value))
+
+	@classmethod
+	def get(cls, source: Source):
+		with cls._lock:
+			return cls._specs.get(source)
+
+	@classmethod
+	def specs(cls):
+		with cls._lock:
+			return list(cls._specs.values())
+
+	@classmethod
+	def sources(cls):
+		# the sources to scrap and show
+		return [spec.source for spec in cls.specs() if spec.source is not Source.NOOP]
+
+	@classmethod
+	def create(cls, source: Source, settings: Settings):
+		spec = cls.get(source)
+		if spec is None:
+			spec = cls.get(Source.NOOP)
+		return spec.create(settings)
+
+
+SourceRegistry.register(SourceSpec(Source.NOOP, SourceRegistry.SCRAPPERS["noop"]))
+SourceRegistry.configure(SourceRegistry.BUILTIN_SOURCES)
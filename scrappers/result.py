@@ -6,6 +6,7 @@ import datetime
 from .sources import Source
 from .util.exception_info import ExceptionInfo
 from .util.formatters import percentage_str
+from .timing import ScrapTimings
 
 
 class ResultItemStatus(Enum):
@@ -81,16 +82,22 @@ class ResultItem(object):
 
 
 class Result(object):
-	def __init__(self, source: Source, ts_start: datetime.datetime=None):
+	def __init__(self, source: Source, ts_start: datetime.datetime=None, job_id: int=None):
 		self._source = source
+		self._job_id = job_id
 		self._ts_start = ts_start if ts_start is not None else datetime.datetime.now()
 		self._time_taken = "unknown"
+		self._scrap_stat_id = None
 		self._items = list()
 		self._general_error = list()
+		self._timings = ScrapTimings()
 
 	def __str__(self):
 		return f"Result of [{self._source.value}] scrapper: {self.items_succeeded_count} of {self.items_count} ({self.success_percentage_str}) scrapped in {self.time_taken}"
 
+	def on_scrapping_started(self, scrap_stat_id: int):
+		self._scrap_stat_id = scrap_stat_id
+
 	def on_item(self, result_item: ResultItem):
 		self._items.append(result_item)
 
@@ -103,10 +110,26 @@ class Result(object):
 	def get_items(self, item_predicate=None):
 		return self._items if item_predicate is None else [item for item in self._items if item_predicate(item)]
 
+	@property
+	def source(self):
+		return self._source
+
+	@property
+	def job_id(self):
+		return self._job_id
+
+	@property
+	def scrap_stat_id(self):
+		return self._scrap_stat_id
+
 	@property
 	def time_taken(self):
 		return self._time_taken
 
+	@property
+	def timings(self):
+		return self._timings
+
 	@property
 	def items(self):
 		return self.get_items()
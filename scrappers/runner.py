@@ -0,0 +1,63 @@
+import datetime
+import concurrent.futures
+from .settings import Settings
+from .result import Result
+from .factory import create
+from .database import close_thread_connections
+from .util.exception_info import ExceptionInfo
+
+
+class MultiScrapRunner(object):
+
+	# how long to wait for the scrappers to wrap up (cancel pending downloads, write stats) after the deadline
+	DEADLINE_GRACE_SECONDS = 30.0
+
+	def __init__(self, settings: Settings):
+		self._settings = settings
+
+	def scrap(self, sources: list, results: dict=None, job_id: int=None, on_source_finished: callable=None):
+		# "on_source_finished(source)" is called once the scrap of the source really ends, which may be after this returns (past the deadline)
+		results = results if results is not None else dict()
+		ts_start = datetime.datetime.now()
+		deadline = None if self._settings.scrap_timeout is None else ts_start + datetime.timedelta(seconds=self._settings.scrap_timeout)
+
+		for source in sources:
+			results[source] = Result(source, ts_start, job_id)
+
+		if len(sources) == 0:
+			return results
+
+		# every source hits a different host, so they all run at once
+		executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="scrap")
+		futures = dict()
+		try:
+			for source in sources:
+				futures[executor.submit(self._scrap_source, source, results[source], deadline, on_source_finished)] = source
+			wait_timeout = None if deadline is None else self._settings.scrap_timeout + MultiScrapRunner.DEADLINE_GRACE_SECONDS
+			_, not_done = concurrent.futures.wait(futures.keys(), timeout=wait_timeout)
+
+			for future in not_done:
+				try:
+					raise TimeoutError(f"scrapper did not finish within the deadline ({self._settings.scrap_timeout}s)")
+				except:
+					results[futures[future]].on_scrapping_exception(ExceptionInfo.createFromLastException())
+
+		finally:
+			executor.shutdown(wait=False)
+			# the sources that never got a thread
+			if on_source_finished is not None:
+				for source in [s for s in sources if s not in futures.values()]:
+					on_source_finished(source)
+
+		return results
+
+	def _scrap_source(self, source, result: Result, deadline: datetime.datetime, on_source_finished: callable=None):
+		try:
+			create(source=source, settings=self._settings).scrap(result, deadline)
+		except:
+			result.on_scrapping_exception(ExceptionInfo.createFromLastException())
+			result.on_scrapping_finished()
+		finally:
+			close_thread_connections()
+			if on_source_finished is not None:
+				on_source_finished(source)
@@ -0,0 +1,211 @@
+import threading, queue
+import datetime
+import traceback
+from enum import Enum
+from .sources import Source
+from .settings import Settings
+from .runner import MultiScrapRunner
+from .database import DbScrapJobs
+from .util.exception_info import ExceptionInfo
+
+
+class ScrapJobState(Enum):
+	QUEUED = "queued"
+	RUNNING = "running"
+	FINISHED = "finished"
+
+
+class ScrapJob(object):
+	def __init__(self, job_id: int, sources: list, ts_queued: datetime.datetime=None):
+		self._job_id = job_id
+		self._sources = sources
+		self._state = ScrapJobState.QUEUED
+		self._ts_queued = ts_queued if ts_queued is not None else datetime.datetime.now()
+		self._results = dict()
+		self._general_error = list()
+
+	def __str__(self):
+		return f"Scrap job #{self.job_id} [{', '.join(s.value for s in self.sources)}]: {self.state.value}"
+
+	def on_job_started(self):
+		self._state = ScrapJobState.RUNNING
+
+	def on_job_exception(self, error: ExceptionInfo):
+		self._general_error.append(error)
+
+	def on_job_finished(self):
+		self._state = ScrapJobState.FINISHED
+
+	@property
+	def job_id(self):
+		return self._job_id
+
+	@property
+	def sources(self):
+		return self._sources
+
+	@property
+	def state(self):
+		return self._state
+
+	@property
+	def ts_queued(self):
+		return self._ts_queued
+
+	@property
+	def results(self):
+		return self._results
+
+	@property
+	def general_error_list(self):
+		return self._general_error
+
+
+class ScrapScheduler(object):
+
+	TIMER_RESOLUTION_SECONDS = 1.0
+
+	def __init__(self, settings: Settings, worker_count: int=1, intervals: dict=None):
+		self._settings = settings
+		self._worker_count = max(1, worker_count)
+		self._intervals = intervals if intervals is not None else {}
+		self._queue = queue.Queue()
+		self._lock = threading.Lock()
+		# the jobs are in the datafile (the scraps of other worker processes included), this process only keeps the ones it runs
+		self._db_jobs = DbScrapJobs.create(settings.sqlite_datafile)
+		self._active_sources = dict()
+		self._last_enqueued = dict()
+		self._stop_event = threading.Event()
+		self._threads = list()
+
+	def start(self):
+		with self._lock:
+			if len(self._threads) > 0:
+				return
+
+			self._stop_event.clear()
+			for i in range(self._worker_count):
+				self._threads.append(threading.Thread(target=self._worker_loop, name=f"scrap-worker-{i}", daemon=True))
+
+			if len(self._intervals) > 0:
+				self._threads.append(threading.Thread(target=self._timer_loop, name="scrap-timer", daemon=True))
+
+			for t in self._threads:
+				t.start()
+
+	def stop(self):
+		self._stop_event.set()
+		for _ in range(self._worker_count):
+			self._queue.put(None)
+
+		with self._lock:
+			threads, self._threads = self._threads, list()
+
+		for t in threads:
+			t.join()
+
+	def enqueue(self, sources: list):
+		# None when there is nothing to scrap
+		with self._lock:
+			# a source already queued or running is not scrapped again, the caller gets the job that covers it
+			sources_to_scrap = [s for s in sources if s not in self._active_sources]
+			if len(sources_to_scrap) == 0:
+				return self._active_sources.get(sources[0]) if len(sources) > 0 else None
+
+			ts_queued = datetime.datetime.now()
+			job = ScrapJob(self._db_jobs.add(sources_to_scrap, ts_queued), sources_to_scrap, ts_queued)
+			for s in sources_to_scrap:
+				self._active_sources[s] = job
+				self._last_enqueued[s] = job.ts_queued
+
+		self._queue.put(job)
+		return job
+
+	def read_job_status(self, job_id: int):
+		# the status of a job queued by any worker process, None for an unknown job
+		job = self._db_jobs.read_job(job_id)
+		if job is None:
+			return None
+
+		if job["ts_finished"] is not None:
+			state = ScrapJobState.FINISHED
+		elif job["ts_started"] is not None:
+			state = ScrapJobState.RUNNING
+		else:
+			state = ScrapJobState.QUEUED
+
+		return {
+			"job_id": job["job_id"],
+			"state": state.value,
+			"queued": str(job["ts_queued"]),
+			# served to anyone asking, the tracebacks (paths, code) are left out
+			"sources": { source: None if scrap is None else { k: v for (k, v) in scrap.items() if k != "exc_traceback" } for (source, scrap) in job["scraps"].items() },
+			"errors": job["errors"],
+		}
+
+	def _worker_loop(self):
+		while not self._stop_event.is_set():
+			job = self._queue.get()
+			if job is None:
+				break
+
+			try:
+				self._run_job(job)
+			finally:
+				job.on_job_finished()
+				self._on_job_finished(job)
+
+	def _run_job(self, job: ScrapJob):
+		job.on_job_started()
+		try:
+			self._db_jobs.on_job_started(job.job_id, datetime.datetime.now())
+		except:
+			job.on_job_exception(ExceptionInfo.createFromLastException())
+
+		try:
+			# results are registered into the job before the scrappers start, the scraps are recorded with the job id
+			# a source stays reserved until its scrapper thread ends, even when the job gives up on it at the deadline
+			MultiScrapRunner(self._settings).scrap(job.sources, job.results, job.job_id, self._release_source)
+		except:
+			job.on_job_exception(ExceptionInfo.createFromLastException())
+
+	def _release_source(self, source: Source):
+		with self._lock:
+			self._active_sources.pop(source, None)
+
+	def _on_job_finished(self, job: ScrapJob):
+		# the errors of the scraps with a record are in the record, the rest (e.g. a source scrapped by another process) goes to the job
+		errors = [*job.general_error_list]
+		for result in job.results.values():
+			if result.scrap_stat_id is None:
+				errors.extend(result.general_error_list)
+
+		try:
+			self._db_jobs.on_job_finished(job.job_id, datetime.datetime.now(), errors)
+		except:
+			traceback.print_exc()
+
+	def _timer_loop(self):
+		while not self._stop_event.wait(ScrapScheduler.TIMER_RESOLUTION_SECONDS):
+			ts_now = datetime.datetime.now()
+			with self._lock:
+				due_sources = [s for (s, interval) in self._intervals.items() if s not in self._active_sources and (s not in self._last_enqueued or (ts_now - self._last_enqueued[s]).total_seconds() >= interval)]
+
+			if len(due_sources) > 0:
+				# every worker process has its timer, the source may have been scrapped by another one meanwhile
+				try:
+					last_starts = self._db_jobs.read_last_starts()
+				except:
+					traceback.print_exc()
+					continue
+
+				for s in [s for s in due_sources if s.value in last_starts and (ts_now - last_starts[s.value]).total_seconds() < self._intervals[s]]:
+					due_sources.remove(s)
+					with self._lock:
+						self._last_enqueued[s] = last_starts[s.value]
+
+			if len(due_sources) > 0:
+				try:
+					self.enqueue(due_sources)
+				except:
+					traceback.print_exc()
@@ -0,0 +1,132 @@
+import threading
+import time
+import random
+import datetime
+import email.utils
+import urllib.parse
+import requests
+import requests.adapters
+from .settings import Settings
+from .politeness import HostPoliteness, CircuitOpenError
+from .util.metrics import Metrics
+
+
+_RETRIES = Metrics.counter("scrapper_http_retries_total", "Requests retried by host.", ("host", ))
+_REJECTED = Metrics.counter("scrapper_http_circuit_open_total", "Requests not made by host, its circuit breaker was open.", ("host", ))
+
+
+# keep-alive session shared by all scrappers, each host gets its own connection pool (requests' HTTPAdapter)
+# the requests to a host are rate limited and stopped by its circuit breaker (see HostPoliteness), the transient errors are retried
+class HttpSession(object):
+
+	RETRY_STATUSES = (429, 500, 502, 503, 504)
+	RETRY_BACKOFF_FACTOR = 0.5
+	RETRY_BACKOFF_MAX = 30.0
+	# a longer "Retry-After" is not waited for, the request fails right away
+	RETRY_AFTER_MAX = 120.0
+
+	_shared_sessions = dict()
+	_shared_sessions_lock = threading.Lock()
+
+	@classmethod
+	def shared(cls, settings: Settings, headers: dict=None):
+		_headers = headers if headers is not None else {}
+		key = (tuple(sorted(_headers.items())), settings.http_timeout, settings.http_retries, settings.download_workers, settings.host_rate_limit, settings.host_rate_burst, settings.breaker_failures, settings.breaker_reset)
+		with cls._shared_sessions_lock:
+			if key not in cls._shared_sessions:
+				cls._shared_sessions[key] = cls(_headers, settings.http_timeout, settings.http_retries, settings.download_workers, settings.host_rate_limit, settings.host_rate_burst, settings.breaker_failures, settings.breaker_reset)
+			return cls._shared_sessions[key]
+
+	def __init__(self, headers: dict, timeout: tuple, retries: int, pool_maxsize: int, rate_limit: float=None, rate_burst: int=1, breaker_failures: int=None, breaker_reset: float=300.0):
+		self._timeout = timeout
+		self._retries = max(0, retries)
+		self._rate_limit = rate_limit
+		self._rate_burst = rate_burst
+		self._breaker_failures = breaker_failures
+		self._breaker_reset = breaker_reset
+		self._session = requests.Session()
+		self._session.headers.update(headers)
+
+		# no retries by the adapter, get() makes them (rate limited)
+		adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_maxsize)
+		self._session.mount("http://", adapter)
+		self._session.mount("https://", adapter)
+
+	@property
+	def headers(self):
+		return self._session.headers
+
+	def _politeness(self, url: str):
+		return HostPoliteness.get(urllib.parse.urlsplit(url).netloc, self._rate_limit, self._rate_burst, self._breaker_failures, self._breaker_reset)
+
+	@staticmethod
+	def _retry_after_seconds(retry_after: str):
+		# "Retry-After" is either seconds or a http date, None when missing or malformed
+		if retry_after is None:
+			return None
+		if retry_after.strip().isdigit():
+			return float(retry_after.strip())
+		try:
+			ts_retry = email.utils.parsedate_to_datetime(retry_after)
+		except (TypeError, ValueError):
+			return None
+		return max(0.0, (ts_retry - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+	@staticmethod
+	def _backoff(attempt: int, retry_after: str=None, deadline: datetime.datetime=None):
+		# the seconds before the next attempt, None when the server asks to wait too long or when the deadline has passed
+		retry_after_seconds = HttpSession._retry_after_seconds(retry_after)
+		if retry_after_seconds is not None:
+			delay = retry_after_seconds if retry_after_seconds <= HttpSession.RETRY_AFTER_MAX else None
+		else:
+			# with jitter, so the download workers do not retry in step
+			delay = min(HttpSession.RETRY_BACKOFF_MAX, HttpSession.RETRY_BACKOFF_FACTOR * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+		if delay is None or deadline is None:
+			return delay
+		# the last attempt is made by the deadline, not after it
+		seconds_left = (deadline - datetime.datetime.now()).total_seconds()
+		return min(delay, seconds_left) if seconds_left > 0 else None
+
+	def get(self, url: str, deadline: datetime.datetime=None, **kwargs):
+		# raises CircuitOpenError when the host failed too many times, the request is not made then
+		# the retries do not wait past the "deadline"
+		kwargs.setdefault("timeout", self._timeout)
+		politeness = self._politeness(url)
+		attempt = 0
+
+		while True:
+			try:
+				politeness.before_request()
+			except CircuitOpenError:
+				_REJECTED.inc(host=politeness.host)
+				# the failed attempts so far count (e.g. when this was the probe of a half-open breaker)
+				if attempt > 0:
+					politeness.on_failure()
+				raise
+
+			try:
+				response = self._session.get(url, **kwargs)
+			except (requests.ConnectionError, requests.Timeout):
+				delay = HttpSession._backoff(attempt, deadline=deadline)
+				if attempt >= self._retries or delay is None:
+					politeness.on_failure()
+					raise
+			else:
+				# the other errors (e.g. 404) are of the item, not of the host
+				if response.status_code not in HttpSession.RETRY_STATUSES:
+					politeness.on_success()
+					return response
+
+				delay = HttpSession._backoff(attempt, response.headers.get("Retry-After"), deadline)
+				if attempt >= self._retries or delay is None:
+					politeness.on_failure()
+					return response
+				response.close()
+
+			_RETRIES.inc(host=politeness.host)
+			time.sleep(delay)
+			attempt += 1
+
+	def close(self):
+		self._session.close()
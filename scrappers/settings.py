@@ -3,10 +3,25 @@ import pathlib
 
 
 class Settings(object):
-	def __init__(self, local_base_path: pathlib.Path, local_relative_path: pathlib.Path, sqlite_datafile: pathlib.Path):
+	def __init__(self, local_base_path: pathlib.Path, local_relative_path: pathlib.Path, sqlite_datafile: pathlib.Path, download_workers: int=4, http_timeout: tuple=(5.0, 30.0), http_retries: int=3, scrap_timeout: float=None, db_write_batch_size: int=1, db_write_batch_interval: float=None, dedup_window_days: int=183, link_extractor: str="streaming", max_image_size: int=None, image_store: str="dated", image_variants: dict=None, host_rate_limit: float=None, host_rate_burst: int=1, breaker_failures: int=None, breaker_reset: float=300.0):
 		self._base_path = local_base_path
 		self._relative_path = local_relative_path
 		self._sqlite_datafile = sqlite_datafile
+		self._download_workers = max(1, download_workers)
+		self._http_timeout = http_timeout
+		self._http_retries = http_retries
+		self._scrap_timeout = scrap_timeout
+		self._db_write_batch_size = db_write_batch_size
+		self._db_write_batch_interval = db_write_batch_interval
+		self._dedup_window_days = dedup_window_days
+		self._link_extractor = link_extractor
+		self._max_image_size = max_image_size
+		self._image_store = image_store
+		self._image_variants = image_variants if image_variants is not None else { "thumb": 480, "web": 1280 }
+		self._host_rate_limit = host_rate_limit
+		self._host_rate_burst = host_rate_burst
+		self._breaker_failures = breaker_failures
+		self._breaker_reset = breaker_reset
 
 	@property
 	def base_path(self):
@@ -23,3 +38,63 @@ class Settings(object):
 	@property
 	def sqlite_datafile(self):
 		return self._sqlite_datafile
+
+	@property
+	def download_workers(self):
+		return self._download_workers
+
+	@property
+	def http_timeout(self):
+		return self._http_timeout
+
+	@property
+	def http_retries(self):
+		return self._http_retries
+
+	@property
+	def scrap_timeout(self):
+		return self._scrap_timeout
+
+	@property
+	def db_write_batch_size(self):
+		return self._db_write_batch_size
+
+	@property
+	def db_write_batch_interval(self):
+		return self._db_write_batch_interval
+
+	@property
+	def dedup_window_days(self):
+		return self._dedup_window_days
+
+	@property
+	def link_extractor(self):
+		return self._link_extractor
+
+	@property
+	def max_image_size(self):
+		return self._max_image_size
+
+	@property
+	def image_store(self):
+		return self._image_store
+
+	@property
+	def image_variants(self):
+		return self._image_variants
+
+	@property
+	def host_rate_limit(self):
+		return self._host_rate_limit
+
+	@property
+	def host_rate_burst(self):
+		return self._host_rate_burst
+
+	@property
+	def breaker_failures(self):
+		return self._breaker_failures
+
+	@property
+	def breaker_reset(self):
+		return self._breaker_reset
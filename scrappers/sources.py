@@ -1,13 +1,37 @@
-import enum
-
-class Source(enum.Enum):
-	NOOP = "noop"
-	ROUMEN = "roumen"
-	ROUMEN_MASO = "roumen-maso"
-
-	@staticmethod
-	def of(source):
-		for e in Source:
-			if e.value == source:
-				return e
-		return Source.NOOP
\ No newline at end of file
+import threading
+
+
+class Source(object):
+	# a scrap source, its value names it in the urls and in the database
+	# the sources are interned (one instance per value), so they compare by identity, the scrappers of them are in the SourceRegistry
+
+	_sources = dict()
+	_lock = threading.Lock()
+
+	def __init__(self, value: str):
+		self._value = value
+
+	def __repr__(self):
+		return f"<Source {self._value}>"
+
+	@property
+	def value(self):
+		return self._value
+
+	@classmethod
+	def named(cls, value: str):
+		with cls._lock:
+			if value not in cls._sources:
+				cls._sources[value] = cls(value)
+			return cls._sources[value]
+
+	@classmethod
+	def of(cls, source):
+		# the unknown values fall back to NOOP
+		with cls._lock:
+			return cls._sources.get(source, cls.NOOP)
+
+
+Source.NOOP = Source.named("noop")
+Source.ROUMEN = Source.named("roumen")
+Source.ROUMEN_MASO = Source.named("roumen-maso")
@@ -0,0 +1,196 @@
+import os, pathlib
+import shutil
+import datetime
+import hashlib
+from .sources import Source
+from .downloader import DownloadInfo
+from .variants import VariantGenerator
+from .database import DbItemMaintenance
+
+
+class ImageStore(object):
+	# places the downloaded images under "scrap_path", returns their path relative to it
+
+	TEMP_DIRECTORY = ".tmp"
+
+	def __init__(self, scrap_path: pathlib.Path):
+		self._scrap_path = scrap_path
+
+	@property
+	def temp_path(self):
+		# on the same file system as the images, so they can be moved atomically
+		temp_path = self._scrap_path / ImageStore.TEMP_DIRECTORY
+		temp_path.mkdir(parents=True, exist_ok=True)
+		return temp_path
+
+	def put(self, download_info: DownloadInfo, source: Source, ts: datetime.datetime, name: str):
+		try:
+			relative_path = self._relative_path(download_info.content_hash, source, ts, name)
+			self._move(download_info.temp_file, relative_path)
+			return relative_path
+
+		finally:
+			if download_info.temp_file.exists():
+				download_info.temp_file.unlink()
+
+	def _relative_path(self, content_hash: str, source: Source, ts: datetime.datetime, name: str):
+		raise NotImplementedError()
+
+	def _move(self, file: pathlib.Path, relative_path: pathlib.Path):
+		destination = self._scrap_path / relative_path
+		destination.parent.mkdir(parents=True, exist_ok=True)
+		os.replace(file, destination)
+		ImageStore._fsync_directory(destination.parent)
+
+	@staticmethod
+	def _fsync_directory(directory: pathlib.Path):
+		# makes the rename durable, not available on windows
+		if not hasattr(os, "O_DIRECTORY"):
+			return
+
+		fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+		try:
+			os.fsync(fd)
+		finally:
+			os.close(fd)
+
+
+class DatedImageStore(ImageStore):
+	# path will be like "{source}/{yyyy}/{week}/{image.jpg}"
+	def _relative_path(self, content_hash: str, source: Source, ts: datetime.datetime, name: str):
+		return pathlib.Path(source.value).joinpath(f"{ts:%Y}").joinpath(f"{ts:%V}").joinpath(name)
+
+
+class ContentAddressedImageStore(ImageStore):
+	# path will be like "blobs/{ab}/{cd}/{abcd...}.jpg", an image posted again (under any name, by any source) is stored once
+
+	BLOB_DIRECTORY = "blobs"
+
+	@staticmethod
+	def blob_path(content_hash: str, name: str):
+		return pathlib.Path(ContentAddressedImageStore.BLOB_DIRECTORY).joinpath(content_hash[0:2]).joinpath(content_hash[2:4]).joinpath(content_hash + pathlib.PurePath(name).suffix.lower())
+
+	def _relative_path(self, content_hash: str, source: Source, ts: datetime.datetime, name: str):
+		return ContentAddressedImageStore.blob_path(content_hash, name)
+
+	def _move(self, file: pathlib.Path, relative_path: pathlib.Path):
+		if not (self._scrap_path / relative_path).exists():
+			super()._move(file, relative_path)
+
+
+IMAGE_STORES = {
+	"dated": DatedImageStore,
+	"content": ContentAddressedImageStore,
+}
+
+
+def create_image_store(name: str, scrap_path: pathlib.Path):
+	return IMAGE_STORES.get(name, DatedImageStore)(scrap_path)
+
+
+# files whose items are pointed at the blobs in one transaction, their originals are removed after it
+DEDUPLICATE_BATCH_SIZE = 100
+
+
+def _copy_to_blob(file: pathlib.Path, scrap_path: pathlib.Path, blob_path: pathlib.Path):
+	# the original stays until the items point at the blob, a hard link is enough (a copy on file systems without them)
+	destination = scrap_path / blob_path
+	if destination.exists():
+		return
+
+	temp_path = scrap_path / ImageStore.TEMP_DIRECTORY
+	temp_path.mkdir(parents=True, exist_ok=True)
+	temp_file = temp_path / destination.name
+	if temp_file.exists():
+		temp_file.unlink()
+
+	try:
+		os.link(file, temp_file)
+	except OSError:
+		shutil.copyfile(file, temp_file)
+
+	destination.parent.mkdir(parents=True, exist_ok=True)
+	os.replace(temp_file, destination)
+	ImageStore._fsync_directory(destination.parent)
+
+
+def deduplicate_image_tree(sqlite_datafile: pathlib.Path, scrap_path: pathlib.Path):
+	# moves the already scrapped images into the content addressed store and points their items at the blobs
+	# every file is copied (linked) first, then its items are updated, and only then the original is removed,
+	# so an interrupted run leaves no item pointing at a missing file and can just be started again
+	# the variants move along with the images (as they would be made of the blobs), the old files are removed with the originals
+	db = DbItemMaintenance.create(sqlite_datafile)
+	items_of_path = dict()
+	for (scrap_item_id, local_path, thumb_path, web_path) in db.read_item_paths():
+		if not local_path.startswith(ContentAddressedImageStore.BLOB_DIRECTORY + "/"):
+			items_of_path.setdefault(local_path, list()).append((scrap_item_id, { "thumb": thumb_path, "web": web_path }))
+
+	updated_count = 0
+	updates = list()
+	originals = list()
+
+	def _commit_batch():
+		db.update_items(updates)
+		for file in originals:
+			# a variant may be shared by the items of the file
+			file.unlink(missing_ok=True)
+		updates.clear()
+		originals.clear()
+
+	def _moved_variant(variant: str, variant_path: str, local_path: str, blob_path: pathlib.Path):
+		# the path of the variant of the blob, None when the backfill has to make it
+		if variant_path is None or variant_path == local_path:
+			# the original stands in for the variant
+			return None if variant_path is None else blob_path.as_posix()
+
+		variant_file = scrap_path / variant_path
+		if variant_path != VariantGenerator.variant_path(variant, local_path).as_posix() or not variant_file.is_file():
+			return None
+
+		blob_variant_path = VariantGenerator.variant_path(variant, blob_path.as_posix())
+		_copy_to_blob(variant_file, scrap_path, blob_variant_path)
+		originals.append(variant_file)
+		return blob_variant_path.as_posix()
+
+	for (local_path, items) in items_of_path.items():
+		file = scrap_path / local_path
+		if not file.is_file():
+			continue
+
+		content_hash = hashlib.sha256()
+		with open(file, "rb") as f:
+			for chunk in iter(lambda: f.read(1024 * 1024), b""):
+				content_hash.update(chunk)
+
+		blob_path = ContentAddressedImageStore.blob_path(content_hash.hexdigest(), local_path)
+		byte_count = file.stat().st_size
+		_copy_to_blob(file, scrap_path, blob_path)
+
+		for (scrap_item_id, variant_paths) in items:
+			item_values = { "local_path": blob_path.as_posix(), "byte_count": byte_count, "content_hash": content_hash.hexdigest() }
+			for (variant, variant_path) in variant_paths.items():
+				item_values[f"{variant}_path"] = _moved_variant(variant, variant_path, local_path, blob_path)
+			updates.append((scrap_item_id, item_values))
+		originals.append(file)
+		updated_count += len(items)
+
+		if len(originals) >= DEDUPLICATE_BATCH_SIZE:
+			_commit_batch()
+
+	_commit_batch()
+
+	# drop the directories left empty
+	for (directory, _, _) in sorted(os.walk(scrap_path), key=lambda w: len(w[0]), reverse=True):
+		if pathlib.Path(directory) != scrap_path and len(os.listdir(directory)) == 0:
+			os.rmdir(directory)
+
+	return updated_count
+
+
+if __name__ == "__main__":
+	import sys
+	if len(sys.argv) != 3:
+		print(f"usage: python -m scrappers.storage <sqlite datafile> <scrap path, e.g. static/images>")
+		sys.exit(1)
+
+	print(f"items moved: {deduplicate_image_tree(pathlib.Path(sys.argv[1]), pathlib.Path(sys.argv[2]))}")
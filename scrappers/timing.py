@@ -0,0 +1,79 @@
+import threading
+import contextlib
+import time
+import math
+from enum import Enum
+
+
+class ScrapPhase(Enum):
+	INDEX_FETCH = "index_fetch"
+	PARSE = "parse"
+	DEDUP = "dedup"
+	DOWNLOAD = "download"
+	VARIANTS = "variants"
+	DB_READ = "db_read"
+	DB_WRITE = "db_write"
+
+
+class ScrapTimings(object):
+	# time spent in the phases of a scrap (in seconds), the downloads run concurrently,
+	# so their phases sum up the time of all the download workers, not the wall time
+
+	LATENCY_PERCENTILES = (50, 90, 99)
+
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._durations = { phase: 0.0 for phase in ScrapPhase }
+		self._item_latencies = list()
+		self._byte_count = 0
+
+	@contextlib.contextmanager
+	def span(self, phase: ScrapPhase):
+		ts_start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.add(phase, time.perf_counter() - ts_start)
+
+	def add(self, phase: ScrapPhase, seconds: float):
+		with self._lock:
+			self._durations[phase] = self._durations.get(phase, 0.0) + seconds
+
+	def on_item_downloaded(self, latency: float, byte_count: int):
+		with self._lock:
+			self._item_latencies.append(latency)
+			self._byte_count += byte_count if byte_count is not None else 0
+
+	def duration(self, phase: ScrapPhase):
+		with self._lock:
+			return self._durations.get(phase, 0.0)
+
+	def latency_percentile(self, percentile: int):
+		# nearest rank, None without items
+		with self._lock:
+			latencies = sorted(self._item_latencies)
+
+		if len(latencies) == 0:
+			return None
+
+		return latencies[max(0, math.ceil(percentile / 100 * len(latencies)) - 1)]
+
+	@property
+	def durations(self):
+		with self._lock:
+			return dict(self._durations)
+
+	@property
+	def item_count(self):
+		with self._lock:
+			return len(self._item_latencies)
+
+	@property
+	def byte_count(self):
+		with self._lock:
+			return self._byte_count
+
+	@property
+	def latency_max(self):
+		with self._lock:
+			return max(self._item_latencies) if len(self._item_latencies) > 0 else None
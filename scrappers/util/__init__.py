@@ -1,6 +1,9 @@
 __version__ = "v0.1"
-__all__ = [ "exception_info", "formatters" ]
+__all__ = [ "exception_info", "formatters", "response_cache", "assets", "metrics" ]
 
 from .exception_info import ExceptionInfo
 from .formatters import *
+from .response_cache import ResponseCache, CachedResponse
+from .assets import compile_less
+from .metrics import Metrics
 
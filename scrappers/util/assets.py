@@ -0,0 +1,53 @@
+import os, pathlib
+import hashlib
+
+try:
+	import lesscpy
+except ImportError:
+	# in the requirements, the app refuses to start without it
+	lesscpy = None
+
+
+def compile_less(less_file: pathlib.Path, output_directory: pathlib.Path):
+	# compiles "name.less" into minified "name.{content hash}.css", the older builds of it are removed
+	# returns the name of the css file, None when it cannot be compiled
+	if lesscpy is None:
+		return None
+
+	with open(less_file, "r", encoding="utf-8") as f:
+		css = lesscpy.compile(f, minify=True).replace("\n", "")
+
+	css_bytes = css.encode("utf-8")
+	name = pathlib.PurePath(less_file).stem
+	css_file_name = f"{name}.{hashlib.sha256(css_bytes).hexdigest()[:16]}.css"
+
+	output_directory.mkdir(parents=True, exist_ok=True)
+	css_file = output_directory / css_file_name
+	if not css_file.exists():
+		temp_file = css_file.with_name(f".{css_file_name}.{os.getpid()}.part")
+		temp_file.write_bytes(css_bytes)
+		os.replace(temp_file, css_file)
+
+	for old_file in output_directory.glob(f"{name}.*.css"):
+		if old_file.name != css_file_name:
+			# another process may be pruning too
+			try:
+				old_file.unlink()
+			except FileNotFoundError:
+				pass
+
+	return css_file_name
+
+
+if __name__ == "__main__":
+	import sys
+	if len(sys.argv) != 3:
+		print(f"usage: python -m scrappers.util.assets <less file> <output directory>")
+		sys.exit(1)
+
+	css_file_name = compile_less(pathlib.Path(sys.argv[1]), pathlib.Path(sys.argv[2]))
+	if css_file_name is None:
+		print("lesscpy is not installed")
+		sys.exit(1)
+
+	print(css_file_name)
@@ -12,6 +12,24 @@ class TIMESTAMP_FORMAT(Enum):
 	DATETIME = "%Y-%m-%d %H:%M.%S"
 	DATETIME_MS = "%Y-%m-%d %H:%M.%S,%f"
 
+# timestamps are stored as microseconds since the epoch, the (naive, local) time is taken as if it was UTC
+EPOCH = datetime.datetime(1970, 1, 1)
+
+def ts_to_us(ts:datetime.datetime=None):
+	_ts = ts if ts is not None else datetime.datetime.now()
+	return (_ts - EPOCH) // datetime.timedelta(microseconds=1)
+
+def us_to_ts(us:int):
+	return EPOCH + datetime.timedelta(microseconds=us)
+
+def utc_offset():
+	# of the local time, rounded to minutes
+	offset = datetime.datetime.now() - datetime.datetime.utcnow()
+	return datetime.timedelta(minutes=round(offset.total_seconds() / 60))
+
+def us_to_utc(us:int):
+	return us_to_ts(us) - utc_offset()
+
 def ts_to_str(format:TIMESTAMP_FORMAT, ts:datetime.datetime.timestamp=None):
 	_ts = ts if ts is not None else datetime.datetime.now()
 	return _ts.strftime(format.value)
@@ -31,6 +49,22 @@ def td_format(td:datetime.timedelta, include_ms):
 			s.append(f"{v:.0f}{period}")
 	return " ".join(s[::-1])
 
+def us_to_duration_str(us:int):
+	# short durations (of the scrap phases), the longer ones by td_format
+	if us is None:
+		return NOT_AVAILABLE_STR
+	if us < 60_000_000:
+		return f"{us / 1000:.1f}ms" if us < 1_000_000 else f"{us / 1_000_000:.2f}s"
+	return td_format(datetime.timedelta(microseconds=us), False)
+
+
+def size_str(byte_count:int):
+	_byte_count = byte_count if byte_count is not None else 0
+	for unit in ["B", "KiB", "MiB", "GiB"]:
+		if _byte_count < 1024 or unit == "GiB":
+			return f"{_byte_count:.0f} {unit}" if unit == "B" else f"{_byte_count:.1f} {unit}"
+		_byte_count /= 1024
+
 
 def percentage_str(count:int, total:int):
 	return NOT_AVAILABLE_STR if total == 0 else f"{(100.0 * count) / total:3.2f}%"
@@ -0,0 +1,149 @@
+import threading
+import contextlib
+import bisect
+import time
+
+
+def _escape_label_value(value):
+	return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(label_pairs: list):
+	if len(label_pairs) == 0:
+		return ""
+	return "{" + ",".join(f"{name}=\"{_escape_label_value(value)}\"" for (name, value) in label_pairs) + "}"
+
+
+def _format_value(value):
+	return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter(object):
+	def __init__(self, name: str, description: str, label_names: tuple=()):
+		self._name = name
+		self._description = description
+		self._label_names = tuple(label_names)
+		self._lock = threading.Lock()
+		self._values = dict()
+
+	@property
+	def name(self):
+		return self._name
+
+	def _label_values(self, labels: dict):
+		# raises KeyError for a missing label
+		return tuple(labels[name] for name in self._label_names)
+
+	def inc(self, amount: float=1, **labels):
+		key = self._label_values(labels)
+		with self._lock:
+			self._values[key] = self._values.get(key, 0) + amount
+
+	def value(self, **labels):
+		with self._lock:
+			return self._values.get(self._label_values(labels), 0)
+
+	def render(self):
+		with self._lock:
+			values = sorted(self._values.items())
+
+		lines = [f"# HELP {self._name} {self._description}", f"# TYPE {self._name} counter"]
+		for (label_values, value) in values:
+			lines.append(f"{self._name}{_format_labels(list(zip(self._label_names, label_values)))} {_format_value(value)}")
+		return lines
+
+
+class Histogram(object):
+	# the bucket upper bounds in seconds, "+Inf" is implied
+	DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+	def __init__(self, name: str, description: str, label_names: tuple=(), buckets: tuple=None):
+		self._name = name
+		self._description = description
+		self._label_names = tuple(label_names)
+		self._buckets = tuple(sorted(buckets if buckets is not None else Histogram.DEFAULT_BUCKETS))
+		self._lock = threading.Lock()
+		# label values -> [counts per bucket (the last one is "+Inf"), sum, count]
+		self._values = dict()
+
+	@property
+	def name(self):
+		return self._name
+
+	def _label_values(self, labels: dict):
+		return tuple(labels[name] for name in self._label_names)
+
+	def observe(self, value: float, **labels):
+		key = self._label_values(labels)
+		bucket_index = bisect.bisect_left(self._buckets, value)
+		with self._lock:
+			entry = self._values.get(key)
+			if entry is None:
+				entry = self._values[key] = [[0] * (len(self._buckets) + 1), 0.0, 0]
+			entry[0][bucket_index] += 1
+			entry[1] += value
+			entry[2] += 1
+
+	@contextlib.contextmanager
+	def time(self, **labels):
+		ts_start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.observe(time.perf_counter() - ts_start, **labels)
+
+	def count(self, **labels):
+		with self._lock:
+			entry = self._values.get(self._label_values(labels))
+			return 0 if entry is None else entry[2]
+
+	def render(self):
+		with self._lock:
+			values = sorted((k, (list(v[0]), v[1], v[2])) for (k, v) in self._values.items())
+
+		lines = [f"# HELP {self._name} {self._description}", f"# TYPE {self._name} histogram"]
+		for (label_values, (bucket_counts, value_sum, value_count)) in values:
+			label_pairs = list(zip(self._label_names, label_values))
+			cumulative_count = 0
+			for (bound, bucket_count) in zip([*map(_format_value, self._buckets), "+Inf"], bucket_counts):
+				cumulative_count += bucket_count
+				lines.append(f"{self._name}_bucket{_format_labels(label_pairs + [('le', bound)])} {cumulative_count}")
+			lines.append(f"{self._name}_sum{_format_labels(label_pairs)} {_format_value(value_sum)}")
+			lines.append(f"{self._name}_count{_format_labels(label_pairs)} {value_count}")
+		return lines
+
+
+class Metrics(object):
+	# metrics of the whole process, rendered in the prometheus text format
+	# every process (e.g. uWSGI worker) counts on its own, the scraper tells them apart by the instance
+
+	CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+	_metrics = dict()
+	_lock = threading.Lock()
+
+	@classmethod
+	def _register(cls, metric_class, name: str, description: str, label_names: tuple, **kwargs):
+		# registering the same name again returns the existing metric
+		with cls._lock:
+			if name not in cls._metrics:
+				cls._metrics[name] = metric_class(name, description, label_names, **kwargs)
+			return cls._metrics[name]
+
+	@classmethod
+	def counter(cls, name: str, description: str, label_names: tuple=()):
+		return cls._register(Counter, name, description, label_names)
+
+	@classmethod
+	def histogram(cls, name: str, description: str, label_names: tuple=(), buckets: tuple=None):
+		return cls._register(Histogram, name, description, label_names, buckets=buckets)
+
+	@classmethod
+	def render(cls):
+		with cls._lock:
+			metrics = list(cls._metrics.values())
+
+		lines = list()
+		for metric in sorted(metrics, key=lambda m: m.name):
+			lines.extend(metric.render())
+		return "\n".join(lines) + "\n"
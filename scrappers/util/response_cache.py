@@ -0,0 +1,59 @@
+import threading
+import hashlib
+import datetime
+
+
+class CachedResponse(object):
+	def __init__(self, body: str, etag: str, last_modified: datetime.datetime):
+		self._body = body
+		self._etag = etag
+		self._last_modified = last_modified
+
+	@property
+	def body(self):
+		return self._body
+
+	@property
+	def etag(self):
+		return self._etag
+
+	@property
+	def last_modified(self):
+		return self._last_modified
+
+
+class ResponseCache(object):
+	# rendered pages shared by the whole process, keyed by (page, source value or None)
+	# an entry is valid for the "version" (e.g. the latest scrap) it was rendered for, the etag is derived from it,
+	# so every process comes to the same etag without sharing the cache
+
+	MAX_ENTRIES = 64
+
+	_entries = dict()
+	_lock = threading.Lock()
+
+	@staticmethod
+	def etag_of(key: tuple, version):
+		return hashlib.sha1(repr((key, version)).encode("utf-8")).hexdigest()
+
+	@classmethod
+	def get(cls, key: tuple, version):
+		with cls._lock:
+			entry = cls._entries.get(key)
+		return entry[1] if entry is not None and entry[0] == version else None
+
+	@classmethod
+	def put(cls, key: tuple, version, body: str, last_modified: datetime.datetime=None):
+		response = CachedResponse(body, ResponseCache.etag_of(key, version), last_modified)
+		with cls._lock:
+			if key not in cls._entries and len(cls._entries) >= ResponseCache.MAX_ENTRIES:
+				cls._entries.pop(next(iter(cls._entries)))
+			cls._entries[key] = (version, response)
+		return response
+
+	@classmethod
+	def invalidate(cls, source: str=None):
+		# drops the pages of the source and the pages of all the sources (keyed by None)
+		with cls._lock:
+			for key in [k for k in cls._entries.keys() if k[1] is None or k[1] == source]:
+				del cls._entries[key]
@@ -0,0 +1,184 @@
+import os, pathlib
+import tempfile
+import threading
+import traceback
+from .settings import Settings
+from .database import DbItemMaintenance, close_thread_connections
+
+try:
+	from PIL import Image, ImageOps
+except ImportError:
+	# in the requirements, the app refuses to start without it (the library users get the originals)
+	Image = None
+
+
+class VariantGenerator(object):
+	# downscaled copies of the scrapped images, stored as "{scrap_path}/variants/{variant}/{local_path}.jpg" (e.g. ".../a.png.jpg")
+	# variants: variant name -> max width, e.g. { "thumb": 480, "web": 1280 }
+
+	VARIANT_DIRECTORY = "variants"
+	JPEG_QUALITY = 80
+	BACKGROUND_COLOR = (255, 255, 255)
+
+	def __init__(self, scrap_path: pathlib.Path, variants: dict):
+		self._scrap_path = scrap_path
+		self._variants = variants
+
+	@staticmethod
+	def available():
+		return Image is not None
+
+	@property
+	def variants(self):
+		return self._variants
+
+	@staticmethod
+	def variant_path(variant: str, local_path: str):
+		# the original suffix is kept, "a.gif" and "a.png" must not share a variant
+		return pathlib.Path(VariantGenerator.VARIANT_DIRECTORY).joinpath(variant).joinpath(local_path + ".jpg")
+
+	def generate(self, local_path: str):
+		# returns variant name -> relative path, the original stands in for the variants not worth (or impossible) to make
+		# returns None when the variants cannot be made at all (no Pillow), so they are made later
+		# a variant that failed to be saved (e.g. on a full disk) is None, left for the backfill too
+		if not VariantGenerator.available():
+			return None
+
+		local_path = str(local_path).replace("\\", "/")
+		variant_paths = { variant: local_path for variant in self._variants.keys() }
+
+		try:
+			with Image.open(self._scrap_path / local_path) as img:
+				# animations would lose their frames
+				if getattr(img, "is_animated", False):
+					return variant_paths
+
+				# decoded here, a broken image fails now and not when a variant is saved
+				img.load()
+				img = ImageOps.exif_transpose(img)
+				for (variant, max_width) in self._variants.items():
+					if img.width > max_width:
+						try:
+							variant_paths[variant] = self._save_variant(img, variant, local_path, max_width).as_posix()
+						except OSError:
+							variant_paths[variant] = None
+		except (OSError, ValueError, Image.DecompressionBombError):
+			pass
+
+		return variant_paths
+
+	def _save_variant(self, img, variant: str, local_path: str, max_width: int):
+		relative_path = VariantGenerator.variant_path(variant, local_path)
+		destination = self._scrap_path / relative_path
+		# the same blob may be shared by many items, its variants are made once
+		if destination.exists():
+			return relative_path
+
+		variant_img = img.copy()
+		variant_img.thumbnail((max_width, max(1, img.height * max_width // img.width)), Image.LANCZOS)
+		if variant_img.mode in ("RGBA", "LA", "P"):
+			variant_img = variant_img.convert("RGBA")
+			background = Image.new("RGB", variant_img.size, VariantGenerator.BACKGROUND_COLOR)
+			background.paste(variant_img, mask=variant_img.split()[-1])
+			variant_img = background
+		elif variant_img.mode != "RGB":
+			variant_img = variant_img.convert("RGB")
+
+		destination.parent.mkdir(parents=True, exist_ok=True)
+		fd, temp_name = tempfile.mkstemp(dir=destination.parent, suffix=".part")
+		try:
+			with os.fdopen(fd, "wb") as f:
+				variant_img.save(f, "JPEG", quality=VariantGenerator.JPEG_QUALITY, optimize=True, progressive=True)
+			os.replace(temp_name, destination)
+		except:
+			if os.path.exists(temp_name):
+				os.unlink(temp_name)
+			raise
+
+		return relative_path
+
+
+class VariantBackfill(object):
+	# makes the variants of the items scrapped before (or without Pillow), a batch at a time in a background thread
+
+	BATCH_SIZE = 50
+	IDLE_SECONDS = 300.0
+
+	def __init__(self, settings: Settings):
+		self._settings = settings
+		self._generator = VariantGenerator(settings.scrap_path, settings.image_variants)
+		self._stop_event = threading.Event()
+		self._thread = None
+
+	def start(self):
+		if self._thread is not None or not VariantGenerator.available():
+			return
+
+		self._stop_event.clear()
+		self._thread = threading.Thread(target=self._loop, name="variant-backfill", daemon=True)
+		self._thread.start()
+
+	def stop(self):
+		self._stop_event.set()
+		if self._thread is not None:
+			self._thread.join()
+			self._thread = None
+
+	def run_batch(self):
+		# returns the number of items done, the items with a variant that failed to be saved are tried again by a later batch
+		db = DbItemMaintenance.create(self._settings.sqlite_datafile)
+		updates = list()
+		done_count = 0
+
+		for (scrap_item_id, local_path) in db.read_items_without_variants(list(self._generator.variants.keys()), VariantBackfill.BATCH_SIZE):
+			if self._stop_event.is_set():
+				break
+
+			variant_paths = self._generator.generate(local_path)
+			if variant_paths is None:
+				continue
+
+			variant_values = { f"{variant}_path": path for (variant, path) in variant_paths.items() if path is not None }
+			if len(variant_values) > 0:
+				updates.append((scrap_item_id, variant_values))
+			if len(variant_values) == len(variant_paths):
+				done_count += 1
+
+		db.update_items(updates)
+		return done_count
+
+	def _loop(self):
+		try:
+			while not self._stop_event.is_set():
+				try:
+					batch_count = self.run_batch()
+				except:
+					traceback.print_exc()
+					batch_count = 0
+
+				# nothing left (or nothing possible now, e.g. on a full disk) to do
+				if batch_count == 0:
+					self._stop_event.wait(VariantBackfill.IDLE_SECONDS)
+		finally:
+			close_thread_connections()
+
+
+if __name__ == "__main__":
+	import sys
+	if len(sys.argv) != 3:
+		print(f"usage: python -m scrappers.variants <sqlite datafile> <scrap path, e.g. static/images>")
+		sys.exit(1)
+
+	if not VariantGenerator.available():
+		print("Pillow is not installed")
+		sys.exit(1)
+
+	backfill = VariantBackfill(Settings(pathlib.Path(sys.argv[2]), pathlib.Path(), pathlib.Path(sys.argv[1])))
+	item_count = 0
+	while True:
+		batch_count = backfill.run_batch()
+		if batch_count == 0:
+			break
+		item_count += batch_count
+
+	print(f"items processed: {item_count}")
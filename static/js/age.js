@@ -0,0 +1,43 @@
+// the ages of the elements having "data-ts-us" (microseconds since the epoch, local time of the server taken as utc)
+// are computed here, so the pages can be cached until the next scrap
+// the age goes to the text of the element, or into its "data-age-attribute" by "data-age-template" ("{age}" gets replaced)
+(function() {
+	var PERIODS = [["s", 60], ["m", 60], ["h", 24], ["d", 7], ["w", null]];
+
+	// same as formatters.td_format (without the milliseconds)
+	function formatAge(seconds) {
+		var parts = [];
+		var r = Math.round(seconds);
+		for (var i = 0; i < PERIODS.length && r > 0; i++) {
+			var factor = PERIODS[i][1];
+			var v = factor !== null ? r % factor : r;
+			r = factor !== null ? Math.floor(r / factor) : 0;
+			parts.push(v + PERIODS[i][0]);
+		}
+		return parts.reverse().join(" ");
+	}
+
+	function updateAges() {
+		var offsetMs = Number(document.body.getAttribute("data-ts-utc-offset-ms")) || 0;
+		var nowUs = (Date.now() + offsetMs) * 1000;
+		var elements = document.querySelectorAll("[data-ts-us]");
+		for (var i = 0; i < elements.length; i++) {
+			var e = elements[i];
+			var tsUs = Number(e.getAttribute("data-ts-us"));
+			if (!tsUs) {
+				continue;
+			}
+
+			var age = formatAge(Math.abs(nowUs - tsUs) / 1000000);
+			var attribute = e.getAttribute("data-age-attribute");
+			if (attribute) {
+				e.setAttribute(attribute, e.getAttribute("data-age-template").replace("{age}", age));
+			} else {
+				e.textContent = age;
+			}
+		}
+	}
+
+	updateAges();
+	window.setInterval(updateAges, 1000);
+})();
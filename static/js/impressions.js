@@ -0,0 +1,67 @@
+// reports the images (".image-view" having "data-item-id") seen by the user to "data-impressions-href" of "#image-list" ("/api/impressions"),
+// every image once per page load, a few at a time
+(function() {
+	var list = document.getElementById("image-list");
+	var REPORT_URL = list.getAttribute("data-impressions-href");
+	var REPORT_INTERVAL_MS = 5000;
+	var VISIBLE_RATIO = 0.5;
+
+	var reported = {};
+	var pending = [];
+
+	function report() {
+		if (pending.length === 0) {
+			return;
+		}
+
+		var body = JSON.stringify({ items: pending });
+		pending = [];
+		if (navigator.sendBeacon) {
+			navigator.sendBeacon(REPORT_URL, new Blob([body], { type: "application/json" }));
+		} else {
+			fetch(REPORT_URL, { method: "POST", body: body, headers: { "Content-Type": "application/json" }, keepalive: true });
+		}
+	}
+
+	var observer = new IntersectionObserver(function(entries) {
+		entries.forEach(function(e) {
+			if (!e.isIntersecting) {
+				return;
+			}
+
+			var itemId = Number(e.target.getAttribute("data-item-id"));
+			if (itemId && !reported[itemId]) {
+				reported[itemId] = true;
+				pending.push(itemId);
+			}
+			observer.unobserve(e.target);
+		});
+	}, { threshold: VISIBLE_RATIO });
+
+	function observeImageViews(root) {
+		var views = root.querySelectorAll(".image-view[data-item-id]");
+		for (var i = 0; i < views.length; i++) {
+			observer.observe(views[i]);
+		}
+	}
+
+	// the views appended by the infinite scroll are observed too
+	observeImageViews(list);
+	new MutationObserver(function(mutations) {
+		mutations.forEach(function(m) {
+			for (var i = 0; i < m.addedNodes.length; i++) {
+				var node = m.addedNodes[i];
+				if (node.nodeType === Node.ELEMENT_NODE && node.matches(".image-view[data-item-id]")) {
+					observer.observe(node);
+				}
+			}
+		});
+	}).observe(list, { childList: true });
+
+	window.setInterval(report, REPORT_INTERVAL_MS);
+	document.addEventListener("visibilitychange", function() {
+		if (document.visibilityState === "hidden") {
+			report();
+		}
+	});
+})();
@@ -0,0 +1,68 @@
+// appends the next pages of the view from "/api/<source>/items" when "#image-list-more" scrolls into view
+(function() {
+	var list = document.getElementById("image-list");
+	var more = document.getElementById("image-list-more");
+	var template = document.getElementById("image-view-template");
+	var loading = false;
+
+	function createImageView(item) {
+		var view = template.content.firstElementChild.cloneNode(true);
+		view.setAttribute("data-item-id", item.item_id);
+		var info = view.querySelector(".image-scrap-info");
+		var ageTemplate = "item info:\ndate: " + item.datetime + "\nage: {age}";
+		info.setAttribute("data-ts-us", item.ts_us);
+		info.setAttribute("data-age-template", ageTemplate);
+		info.setAttribute("data-tooltip", "item info:\ndate: " + item.datetime);
+		view.querySelector(".image-scrap-name-value").textContent = item.name;
+
+		view.querySelector(".image-original").setAttribute("href", item.original_href);
+		var img = view.querySelector("img");
+		img.setAttribute("srcset", item.thumb_href + " " + img.getAttribute("data-thumb-width") + "w, " + item.web_href + " " + img.getAttribute("data-web-width") + "w");
+		img.setAttribute("src", item.thumb_href);
+		img.setAttribute("alt", item.name);
+		return view;
+	}
+
+	function loadNextPage() {
+		var href = more.getAttribute("data-next-href");
+		if (loading || !href) {
+			return;
+		}
+
+		loading = true;
+		fetch(href, { headers: { "Accept": "application/json" } })
+			.then(function(response) {
+				if (!response.ok) {
+					throw new Error(response.status + " " + response.statusText);
+				}
+				return response.json();
+			})
+			.then(function(page) {
+				page.items.forEach(function(item) {
+					list.appendChild(createImageView(item));
+				});
+
+				if (page.next_href) {
+					more.setAttribute("data-next-href", page.next_href);
+				} else {
+					more.removeAttribute("data-next-href");
+					more.textContent = "that's all";
+					observer.disconnect();
+				}
+				loading = false;
+			})
+			.catch(function(error) {
+				// stays put, the next scroll tries again
+				more.textContent = "loading failed (" + error.message + ")";
+				loading = false;
+			});
+	}
+
+	var observer = new IntersectionObserver(function(entries) {
+		if (entries.some(function(e) { return e.isIntersecting; })) {
+			loadNextPage();
+		}
+	}, { rootMargin: "200% 0px" });
+
+	observer.observe(more);
+})();
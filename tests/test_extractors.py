@@ -0,0 +1,81 @@
+import pathlib
+import unittest
+from scrappers.extractors import StreamingLinkExtractor, Bs4LinkExtractor
+
+
+FIXTURES = pathlib.Path(__file__).parent / "fixtures"
+
+# index pages shaped like the ones of the sites (windows-1250, no charset in the headers), with the markup that trips up a naive scanner:
+# links in comments, scripts and styles, "data-href", ">" in quoted values, unquoted and upper case attributes, non-ascii names
+PAGES = [
+	("rouming_index.html", "roumingShow.php"),
+	("roumenovomaso_index.html", "masoShow.php"),
+]
+
+CHUNK_SIZES = (1, 7, 4096)
+
+
+def _chunked(content: bytes, chunk_size: int):
+	return (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+
+
+class ExtractorParityTest(unittest.TestCase):
+	# the streaming extractor has to find what bs4 finds, however the page is split into chunks
+
+	def test_same_links_as_bs4(self):
+		for (page_name, href_needle) in PAGES:
+			content = (FIXTURES / page_name).read_bytes()
+			expected = list(Bs4LinkExtractor(href_needle).extract([content]))
+			self.assertGreater(len(expected), 0, page_name)
+
+			for chunk_size in CHUNK_SIZES:
+				with self.subTest(page=page_name, chunk_size=chunk_size):
+					self.assertEqual(list(StreamingLinkExtractor(href_needle).extract(_chunked(content, chunk_size))), expected)
+
+	def test_skipped_markup(self):
+		for (page_name, href_needle) in PAGES:
+			found = list(StreamingLinkExtractor(href_needle).extract([(FIXTURES / page_name).read_bytes()]))
+			with self.subTest(page=page_name):
+				for name in ("commented_out.jpg", "from_script.jpg", "from_style.jpg", "not_a_link.jpg", "area.jpg"):
+					self.assertNotIn(name, found)
+				self.assertFalse(any(name.startswith("data_") for name in found))
+
+	def test_links_before_the_end(self):
+		# a link comes out as soon as its tag is complete, not once the whole page is read
+		for (page_name, href_needle) in PAGES:
+			content = (FIXTURES / page_name).read_bytes()
+			chunks = list(_chunked(content, 64))
+			read = list()
+
+			def _recorded():
+				for chunk in chunks:
+					read.append(chunk)
+					yield chunk
+
+			with self.subTest(page=page_name):
+				links = StreamingLinkExtractor(href_needle).extract(_recorded())
+				first = next(links)
+				self.assertLess(len(read), len(chunks))
+				self.assertLess(sum(len(chunk) for chunk in read), content.index(first.encode("ascii")) + 1024)
+				self.assertEqual([first] + list(links), list(Bs4LinkExtractor(href_needle).extract([content])))
+
+	def test_ascii_links_do_not_wait_for_the_sniff(self):
+		extractor = StreamingLinkExtractor("roumingShow.php")
+		page = b'<a href="roumingShow.php?file=first.jpg">' + b" " * (2 * StreamingLinkExtractor.SNIFF_MAX_LENGTH)
+		read = list()
+
+		def _recorded():
+			for i in range(0, len(page), 1024):
+				read.append(i)
+				yield page[i:i + 1024]
+
+		self.assertEqual(next(extractor.extract(_recorded())), "first.jpg")
+		self.assertEqual(len(read), 1)
+
+	def test_encoding_given(self):
+		content = '<a href="roumingShow.php?file=kůň.jpg">'.encode("utf-8")
+		self.assertEqual(list(StreamingLinkExtractor("roumingShow.php").extract([content], "utf-8")), ["kůň.jpg"])
+
+
+if __name__ == "__main__":
+	unittest.main()